@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Report the memory footprint of elements and idle clients before and after a change.
+
+Run with `python benchmarks/element_memory.py [--baseline REVISION]`.
+The numbers of the working tree are compared with the numbers of the baseline revision (default: `HEAD`),
+which is exported into a temporary directory and measured in a separate process.
+Elements are created without a running server, so the numbers include the element data structures only.
+"""
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict
+
+ELEMENTS = 20_000
+CLIENTS = 500
+ROOT = Path(__file__).parent.parent
+
+
+def measure(create: Callable[[], None]) -> int:
+    from nicegui import outbox
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    create()
+    for elements in outbox.update_queue.values():  # NOTE: simulate the flush of the outbox like a running server
+        for element in elements.values():
+            element._to_dict()
+            if hasattr(element, '_reset_changes'):  # NOTE: older revisions do not track changes
+                element._reset_changes()
+    outbox.update_queue.clear()
+    outbox.patch_queue.clear()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def measure_all() -> Dict[str, float]:
+    from nicegui import ui
+    from nicegui.client import Client
+    from nicegui.page import page
+
+    clients = []
+    elements = []
+
+    def create_clients() -> None:
+        clients.extend(Client(page('/')) for _ in range(CLIENTS))
+
+    def create_elements(factory: Callable[[], ui.element]) -> Callable[[], None]:
+        def create() -> None:
+            with Client(page('/')):
+                elements.extend(factory() for _ in range(ELEMENTS))
+        return create
+
+    results = {'idle client': measure(create_clients) / CLIENTS}
+    for name, factory in [
+        ('ui.element', lambda: ui.element('div')),
+        ('ui.label', lambda: ui.label('Hello')),
+        ('ui.button', lambda: ui.button('Click', on_click=lambda: None)),
+    ]:
+        results[name] = measure(create_elements(factory)) / ELEMENTS
+        elements.clear()
+    return results
+
+
+def measure_revision(revision: str) -> Dict[str, float]:
+    archive = subprocess.run(['git', 'archive', revision, 'nicegui'], cwd=ROOT, check=True, capture_output=True).stdout
+    with tempfile.TemporaryDirectory() as directory:
+        with tarfile.open(fileobj=BytesIO(archive)) as tar:
+            tar.extractall(directory)
+        output = subprocess.run([sys.executable, __file__, '--json'], cwd=directory, check=True, capture_output=True,
+                                env={'PYTHONPATH': directory}, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default='HEAD', help='git revision to compare with (default: HEAD)')
+    parser.add_argument('--json', action='store_true', help='only print the numbers of the imported nicegui as JSON')
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure_all()))
+        return
+
+    sys.path.insert(0, str(ROOT))
+    before = measure_revision(args.baseline)
+    after = measure_all()
+    print(f'{"bytes per":<20} {args.baseline:>10} {"working tree":>14} {"change":>8}')
+    for name, value in after.items():
+        print(f'{name:<20} {before[name]:>10.0f} {value:>14.0f} {(value - before[name]) / before[name]:>+8.0%}')
+
+
+if __name__ == '__main__':
+    main()
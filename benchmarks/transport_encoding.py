@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Compare payload size and encoding time of the JSON and the MessagePack transport encoding.
+
+Run with `python benchmarks/transport_encoding.py` (requires the optional `msgpack` package).
+
+MessagePack produces smaller payloads for numeric data, but it was slower to encode than NiceGUI's orjson-based JSON
+in the measurements which accompanied its introduction, e.g. 2.28 ms vs. 1.06 ms for the point cloud
+and 3.16 ms vs. 1.88 ms for the joystick events.
+So it is only worth enabling if bandwidth is more limited than server CPU time.
+"""
+import random
+import timeit
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from socketio.packet import EVENT, Packet
+
+from nicegui import json
+from nicegui.msgpack_packet import MsgPackPacket
+
+Packet.json = json  # NOTE: this is what NiceGUI does when using the default JSON encoding
+
+REPETITIONS = 20
+
+
+def chart() -> Any:
+    return ['batch', [['update', {1: {
+        'id': 1,
+        'tag': 'chart',
+        'props': {'options': {'series': [{'data': [random.random() for _ in range(1000)]} for _ in range(10)]}},
+    }}]]]
+
+
+def point_cloud() -> Any:
+    return ['batch', [['run_method', {'id': 2, 'name': 'set_points', 'args': [np.random.rand(5000, 3)]}]]]
+
+
+def table() -> Any:
+    rows = [{'id': i, 'name': f'row {i}', 'value': random.random(), 'active': i % 2 == 0} for i in range(5000)]
+    return ['batch', [['patch', {3: {'props': {'rows': rows}}}]]]
+
+
+def joystick() -> List[Any]:
+    return [
+        ['event', {'id': 4, 'listener_id': 'move', 'args': {'x': random.uniform(-1, 1), 'y': random.uniform(-1, 1)}}]
+        for _ in range(1000)
+    ]
+
+
+def measure(packet_class: Callable[..., Packet], payloads: List[Any]) -> Dict[str, float]:
+    packets = [packet_class(EVENT, data=payload, namespace='/') for payload in payloads]
+    size = sum(len(packet.encode()) for packet in packets)
+    seconds = timeit.timeit(lambda: [packet.encode() for packet in packets], number=REPETITIONS) / REPETITIONS
+    return {'size': size, 'time': seconds}
+
+
+def main() -> None:
+    scenarios = {
+        'chart (10 x 1000 floats)': [chart()],
+        'point cloud (5000 x 3 numpy)': [point_cloud()],
+        'table (5000 rows)': [table()],
+        'joystick (1000 events)': joystick(),
+    }
+    print(f'{"payload":<30} {"encoding":<8} {"bytes":>10} {"ms":>8}')
+    for name, payloads in scenarios.items():
+        for encoding, packet_class in [('json', Packet), ('msgpack', MsgPackPacket)]:
+            result = measure(packet_class, payloads)
+            print(f'{name:<30} {encoding:<8} {result["size"]:>10} {result["time"] * 1000:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
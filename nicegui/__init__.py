@@ -5,7 +5,7 @@ except ModuleNotFoundError:
 
 __version__: str = importlib_metadata.version('nicegui')
 
-from . import elements, globals, ui
+from . import elements, globals, run_executor, ui
 from .api_router import APIRouter
 from .client import Client
 from .nicegui import app
@@ -16,6 +16,7 @@ __all__ = [
     'Client',
     'elements',
     'globals',
+    'run_executor',
     'Tailwind',
     'ui',
     '__version__',
@@ -36,6 +36,9 @@ def create_lazy(coroutine: Awaitable[T], *, name: str) -> None:
     If a third task with the same name is created while the first one is still running, the second one is discarded.
     """
     if name in lazy_tasks_running:
+        waiting = lazy_tasks_waiting.get(name)
+        if asyncio.iscoroutine(waiting):
+            waiting.close()  # NOTE: avoid warnings about discarded coroutines which were never awaited
         lazy_tasks_waiting[name] = coroutine
         return
 
@@ -1,14 +1,25 @@
 import asyncio
+import dataclasses
+import itertools
 import logging
 import time
+import weakref
 from collections import defaultdict
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Type, Union
+from functools import lru_cache
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from . import globals
 
-bindings: DefaultDict[Tuple[int, str], List] = defaultdict(list)
-bindable_properties: Dict[Tuple[int, str], Any] = {}
-active_links: List[Tuple[Any, str, Any, str, Callable[[Any], Any]]] = []
+Key = Tuple[int, str]
+Binding = Tuple[Any, Any, str, Callable[[Any], Any]]
+Link = Tuple[Any, str, Any, str, Callable[[Any], Any]]
+
+bindings: DefaultDict[Key, Dict[int, Binding]] = defaultdict(dict)
+bindable_properties: Dict[Key, Any] = {}
+active_links: Dict[int, Link] = {}
+object_bindings: DefaultDict[int, Set[Tuple[Key, int]]] = defaultdict(set)  # NOTE: index for removing objects
+object_references: Dict[int, '_Reference'] = {}  # NOTE: weak references to objects with bindable properties
+binding_ids = itertools.count()
 
 
 def get_attribute(obj: Union[object, Dict], name: str) -> Any:
@@ -29,7 +40,7 @@ async def loop() -> None:
     while True:
         visited: Set[Tuple[int, str]] = set()
         t = time.time()
-        for link in active_links:
+        for link in list(active_links.values()):
             (source_obj, source_name, target_obj, target_name, transform) = link
             value = transform(get_attribute(source_obj, source_name))
             if get_attribute(target_obj, target_name) != value:
@@ -45,7 +56,7 @@ def propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[int
     if visited is None:
         visited = set()
     visited.add((id(source_obj), source_name))
-    for _, target_obj, target_name, transform in bindings.get((id(source_obj), source_name), []):
+    for _, target_obj, target_name, transform in list(bindings.get((id(source_obj), source_name), {}).values()):
         if (id(target_obj), target_name) in visited:
             continue
         target_value = transform(get_attribute(source_obj, source_name))
@@ -54,18 +65,27 @@ def propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[int
             propagate(target_obj, target_name, visited)
 
 
+def _add_binding(source_obj: Any, source_name: str, target_obj: Any, target_name: str,
+                 transform: Callable[[Any], Any]) -> None:
+    key = (id(source_obj), source_name)
+    binding_id = next(binding_ids)
+    bindings[key][binding_id] = (source_obj, target_obj, target_name, transform)
+    object_bindings[id(source_obj)].add((key, binding_id))
+    object_bindings[id(target_obj)].add((key, binding_id))
+    if key not in bindable_properties:
+        active_links[binding_id] = (source_obj, source_name, target_obj, target_name, transform)
+    value = transform(get_attribute(source_obj, source_name))
+    if get_attribute(target_obj, target_name) != value:
+        set_attribute(target_obj, target_name, value)
+        propagate(target_obj, target_name, {key})
+
+
 def bind_to(self_obj: Any, self_name: str, other_obj: Any, other_name: str, forward: Callable[[Any], Any]) -> None:
-    bindings[(id(self_obj), self_name)].append((self_obj, other_obj, other_name, forward))
-    if (id(self_obj), self_name) not in bindable_properties:
-        active_links.append((self_obj, self_name, other_obj, other_name, forward))
-    propagate(self_obj, self_name)
+    _add_binding(self_obj, self_name, other_obj, other_name, forward)
 
 
 def bind_from(self_obj: Any, self_name: str, other_obj: Any, other_name: str, backward: Callable[[Any], Any]) -> None:
-    bindings[(id(other_obj), other_name)].append((other_obj, self_obj, self_name, backward))
-    if (id(other_obj), other_name) not in bindable_properties:
-        active_links.append((other_obj, other_name, self_obj, self_name, backward))
-    propagate(other_obj, other_name)
+    _add_binding(other_obj, other_name, self_obj, self_name, backward)
 
 
 def bind(self_obj: Any, self_name: str, other_obj: Any, other_name: str, *,
@@ -81,38 +101,179 @@ class BindableProperty:
 
     def __set_name__(self, _, name: str) -> None:
         self.name = name
+        self.attribute_name = '_bindable_' + name  # NOTE: classes with __slots__ need to declare this attribute
 
     def __get__(self, owner: Any, _=None) -> Any:
-        return getattr(owner, '___' + self.name)
+        return getattr(owner, self.attribute_name)
 
     def __set__(self, owner: Any, value: Any) -> None:
-        has_attribute = hasattr(owner, '___' + self.name)
-        value_changed = has_attribute and getattr(owner, '___' + self.name) != value
+        has_attribute = hasattr(owner, self.attribute_name)
+        value_changed = has_attribute and getattr(owner, self.attribute_name) != value
         if has_attribute and not value_changed:
             return
-        setattr(owner, '___' + self.name, value)
-        bindable_properties[(id(owner), self.name)] = owner
+        setattr(owner, self.attribute_name, value)
+        _register_bindable_property(owner, self.name)
         propagate(owner, self.name)
         if value_changed and self.on_change is not None:
             self.on_change(owner, value)
 
 
+class BindableDict(dict):
+    """Dictionary which propagates changes of its items to bound objects immediately.
+
+    In contrast to bindings to a plain dictionary, bindings to a `BindableDict` are not polled by the binding loop.
+    Nested values which are modified in-place are not detected and need to be re-assigned.
+    Bindings of deleted items are kept and take effect again when the item is re-assigned.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        for key in self:
+            _register_bindable_property(self, key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        value_changed = key not in self or self[key] != value
+        super().__setitem__(key, value)
+        _register_bindable_property(self, key)
+        if value_changed:
+            propagate(self, key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        _unregister_bindable_property(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            _unregister_bindable_property(self, key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        _unregister_bindable_property(self, key)
+        return key, value
+
+    def clear(self) -> None:
+        for key in self:
+            _unregister_bindable_property(self, key)
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+class _Reference(weakref.ref):
+    """Weak reference which forgets the bindable properties of the object when it is garbage collected."""
+    __slots__ = ('obj_id', 'names')
+
+    def __new__(cls, obj: Any) -> '_Reference':
+        return super().__new__(cls, obj, _forget_bindable_properties)
+
+    def __init__(self, obj: Any) -> None:  # NOTE: the referent and the callback are passed to __new__
+        self.obj_id = id(obj)
+        self.names: Tuple[Any, ...] = ()
+
+
+def _register_bindable_property(obj: Any, name: Any) -> None:
+    """Register a bindable property, so that bindings to it are not polled by the binding loop.
+
+    The object is referenced weakly and its registrations are forgotten when it is garbage collected.
+    """
+    key = (id(obj), name)
+    if key in bindable_properties:
+        return
+    reference = object_references.get(id(obj))
+    if reference is None:
+        try:
+            reference = object_references[id(obj)] = _Reference(obj)
+        except TypeError:
+            bindable_properties[key] = obj  # NOTE: the object can not be weakly referenced, so it is kept until removed
+            return
+    reference.names += (name,)
+    bindable_properties[key] = reference
+
+
+def _unregister_bindable_property(obj: Any, name: Any) -> None:
+    if bindable_properties.pop((id(obj), name), None) is not None:
+        reference = object_references.get(id(obj))
+        if reference is not None:
+            reference.names = tuple(n for n in reference.names if n != name)
+
+
+def _forget_bindable_properties(reference: '_Reference') -> None:
+    # NOTE: bindings refer to the object strongly, so only its bindable properties can be left
+    if object_references.get(reference.obj_id) is reference:
+        del object_references[reference.obj_id]
+    for name in reference.names:
+        bindable_properties.pop((reference.obj_id, name), None)
+
+
+T = TypeVar('T', bound=type)
+
+
+def bindable_dataclass(cls: Optional[T] = None, **kwargs: Any) -> Any:
+    """Create a dataclass whose fields are bindable properties.
+
+    Changes of the fields are propagated to bound objects immediately instead of being polled by the binding loop.
+    It can be used like `dataclasses.dataclass`, either with or without keyword arguments.
+
+    :param kwargs: keyword arguments passed to `dataclasses.dataclass` (`frozen` and `slots` are not supported)
+    """
+    if kwargs.get('frozen') or kwargs.get('slots'):
+        raise ValueError('bindable_dataclass does not support frozen or slotted dataclasses')
+
+    def wrap(cls: T) -> T:
+        dataclasses.dataclass(cls, **kwargs)  # NOTE: the class is modified in place unless it uses slots
+        for field in dataclasses.fields(cls):
+            bindable_property = BindableProperty()
+            bindable_property.__set_name__(cls, field.name)
+            setattr(cls, field.name, bindable_property)
+        return cls
+
+    return wrap if cls is None else wrap(cls)
+
+
 def remove(objects: List[Any], type: Type) -> None:
-    active_links[:] = [
-        (source_obj, source_name, target_obj, target_name, transform)
-        for source_obj, source_name, target_obj, target_name, transform in active_links
-        if not (isinstance(source_obj, type) and source_obj in objects or
-                isinstance(target_obj, type) and target_obj in objects)
-    ]
-    for key, binding_list in list(bindings.items()):
-        binding_list[:] = [
-            (source_obj, target_obj, target_name, transform)
-            for source_obj, target_obj, target_name, transform in binding_list
-            if not (isinstance(source_obj, type) and source_obj in objects or
-                    isinstance(target_obj, type) and target_obj in objects)
-        ]
-        if not binding_list:
-            del bindings[key]
-    for (obj_id, name), obj in list(bindable_properties.items()):
-        if isinstance(obj, type) and obj in objects:
-            del bindable_properties[(obj_id, name)]
+    """Remove all bindings, active links and bindable properties of the given objects.
+
+    The cost is proportional to the number of bindings of these objects, independent of the total number of bindings.
+
+    :param objects: objects to remove
+    :param type: only objects of this type are removed
+    """
+    objects = [obj for obj in objects if isinstance(obj, type)]
+    for obj in objects:
+        for key, binding_id in object_bindings.pop(id(obj), ()):
+            _remove_binding(key, binding_id)
+        for name in _get_bindable_names(obj):
+            bindable_properties.pop((id(obj), name), None)
+        object_references.pop(id(obj), None)
+
+
+def _remove_binding(key: Key, binding_id: int) -> None:
+    active_links.pop(binding_id, None)
+    source_obj, target_obj, _, _ = bindings[key].pop(binding_id)
+    if not bindings[key]:
+        del bindings[key]
+    for other_obj in (source_obj, target_obj):
+        other_bindings = object_bindings.get(id(other_obj))
+        if other_bindings is not None:
+            other_bindings.discard((key, binding_id))
+            if not other_bindings:
+                del object_bindings[id(other_obj)]
+
+
+def _get_bindable_names(obj: Any) -> Iterable[str]:
+    if isinstance(obj, BindableDict):
+        return list(obj.keys())
+    return _get_bindable_class_names(obj.__class__)
+
+
+@lru_cache(maxsize=None)
+def _get_bindable_class_names(cls: type) -> Tuple[str, ...]:
+    return tuple(name for c in cls.__mro__ for name, value in vars(c).items() if isinstance(value, BindableProperty))
@@ -11,7 +11,7 @@ from fastapi.templating import Jinja2Templates
 from nicegui import json
 
 from . import __version__, globals, outbox
-from .dependencies import generate_js_imports, generate_vue_content
+from .dependencies import get_components_module
 from .element import Element
 from .favicon import get_favicon_url
 
@@ -32,7 +32,9 @@ class Client:
         self.next_element_id: int = 0
         self.is_waiting_for_connection: bool = False
         self.is_waiting_for_disconnect: bool = False
+        self.is_hidden: bool = False
         self.environ: Optional[Dict[str, Any]] = None
+        self._events: Dict[str, asyncio.Event] = {}
         self.shared = shared
 
         with Element('q-layout', _client=self).props('view="HHH LpR FFF"').classes('nicegui-layout') as self.layout:
@@ -40,7 +42,7 @@ class Client:
                 with Element('q-page'):
                     self.content = Element('div').classes('nicegui-content')
 
-        self.waiting_javascript_commands: Dict[str, Any] = {}
+        self.waiting_javascript_commands: Dict[str, asyncio.Future] = {}
 
         self.head_html = ''
         self.body_html = ''
@@ -60,6 +62,11 @@ class Client:
         """Return True if the client is connected, False otherwise."""
         return self.environ is not None
 
+    @property
+    def send_queue_depth(self) -> int:
+        """Return the number of update batches which are waiting to be sent to the client."""
+        return outbox.queue_depth(self.id)
+
     def __enter__(self):
         self.content.__enter__()
         return self
@@ -69,7 +76,6 @@ class Client:
 
     def build_response(self, request: Request, status_code: int = 200) -> Response:
         prefix = request.headers.get('X-Forwarded-Prefix', request.scope.get('root_path', ''))
-        vue_html, vue_styles, vue_scripts = generate_vue_content()
         elements = json.dumps({id: element._to_dict() for id, element in self.elements.items()})
         return templates.TemplateResponse('index.html', {
             'request': request,
@@ -77,9 +83,8 @@ class Client:
             'client_id': str(self.id),
             'elements': elements,
             'head_html': self.head_html,
-            'body_html': f'{self.body_html}\n{vue_html}\n{vue_styles}',
-            'vue_scripts': vue_scripts,
-            'js_imports': generate_js_imports(prefix),
+            'body_html': self.body_html,
+            'components_module': get_components_module().import_path,
             'title': self.page.resolve_title(),
             'viewport': self.page.resolve_viewport(),
             'favicon_url': get_favicon_url(self.page, prefix),
@@ -88,25 +93,48 @@ class Client:
             'prefix': prefix,
             'tailwind': globals.tailwind,
             'socket_io_js_extra_headers': globals.socket_io_js_extra_headers,
+            'transport_encoding': globals.transport_encoding,
         }, status_code, {'Cache-Control': 'no-store', 'X-NiceGUI-Content': 'page'})
 
     async def connected(self, timeout: float = 3.0, check_interval: float = 0.1) -> None:
-        """Block execution until the client is connected."""
+        """Block execution until the client is connected.
+
+        The parameter `check_interval` is not used anymore because the connection event is awaited directly.
+        """
         self.is_waiting_for_connection = True
-        deadline = time.time() + timeout
-        while not self.environ:
-            if time.time() > deadline:
-                raise TimeoutError(f'No connection after {timeout} seconds')
-            await asyncio.sleep(check_interval)
+        self._get_event('waiting_for_connection').set()
+        if not self.has_socket_connection:
+            try:
+                await asyncio.wait_for(self._get_event('connected').wait(), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f'No connection after {timeout} seconds') from None
         self.is_waiting_for_connection = False
 
     async def disconnected(self, check_interval: float = 0.1) -> None:
-        """Block execution until the client disconnects."""
+        """Block execution until the client disconnects.
+
+        The parameter `check_interval` is not used anymore because the disconnection event is awaited directly.
+        """
         self.is_waiting_for_disconnect = True
-        while self.id in globals.clients:
-            await asyncio.sleep(check_interval)
+        if self.id in globals.clients:
+            await self._get_event('deleted').wait()
         self.is_waiting_for_disconnect = False
 
+    def _get_event(self, name: str) -> asyncio.Event:
+        # NOTE: events are created lazily because they must not be created before the event loop is running
+        if name not in self._events:
+            self._events[name] = asyncio.Event()
+        return self._events[name]
+
+    def handle_handshake(self, environ: Dict[str, Any]) -> None:
+        """Mark the client as connected and wake up all coroutines waiting for the connection (for internal use only)."""
+        self.environ = environ
+        self._get_event('connected').set()
+
+    def handle_deletion(self) -> None:
+        """Wake up all coroutines waiting for the client to disconnect (for internal use only)."""
+        self._get_event('deleted').set()
+
     async def run_javascript(self, code: str, *,
                              respond: bool = True, timeout: float = 1.0, check_interval: float = 0.01) -> Optional[Any]:
         """Execute JavaScript on the client.
@@ -114,21 +142,25 @@ class Client:
         The client connection must be established before this method is called.
         You can do this by `await client.connected()` or register a callback with `client.on_connect(...)`.
         If respond is True, the javascript code must return a string.
+        The parameter `check_interval` is not used anymore because the response is awaited directly.
         """
         request_id = str(uuid.uuid4())
         command = {
             'code': code,
             'request_id': request_id if respond else None,
         }
-        outbox.enqueue_message('run_javascript', command, self.id)
         if not respond:
+            outbox.enqueue_message('run_javascript', command, self.id)
             return None
-        deadline = time.time() + timeout
-        while request_id not in self.waiting_javascript_commands:
-            if time.time() > deadline:
-                raise TimeoutError('JavaScript did not respond in time')
-            await asyncio.sleep(check_interval)
-        return self.waiting_javascript_commands.pop(request_id)
+        response: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.waiting_javascript_commands[request_id] = response
+        outbox.enqueue_message('run_javascript', command, self.id)
+        try:
+            return await asyncio.wait_for(response, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError('JavaScript did not respond in time') from None
+        finally:
+            self.waiting_javascript_commands.pop(request_id, None)
 
     def open(self, target: Union[Callable[..., Any], str]) -> None:
         """Open a new page in the client."""
@@ -1,9 +1,12 @@
+import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 import vbuild
 
+from nicegui import json
+
 from . import __version__, globals
 from .helpers import KWONLY_SLOTS
 from .ids import IncrementingStringIds
@@ -56,32 +59,62 @@ def register_component(name: str, py_filepath: str, component_filepath: str, dep
             optional = dependency in optional_dependencies
             js_dependencies[id] = Dependency(id=id, path=path, dependents=set(), optional=optional)
         js_dependencies[id].dependents.add(name)
+    components_modules.clear()
+
+
+@dataclass(**KWONLY_SLOTS)
+class ComponentsModule:
+    code: str
+    hash: str
+
+    @property
+    def import_path(self) -> str:
+        return f'/_nicegui/{__version__}/components.js?v={self.hash}'
+
+
+components_modules: Dict[Tuple[str, ...], ComponentsModule] = {}
+
 
+def get_components_module() -> ComponentsModule:
+    """Return the JavaScript module registering all components which are not excluded.
 
-def generate_vue_content() -> Tuple[str, str, str]:
+    The module is compiled only once per set of excludes and cached until another component is registered.
+    """
+    key = tuple(sorted(globals.excludes))
+    if key not in components_modules:
+        code = generate_components_module()
+        hash = hashlib.sha256(code.encode()).hexdigest()[:16]
+        components_modules[key] = ComponentsModule(code=code, hash=hash)
+    return components_modules[key]
+
+
+def generate_components_module() -> str:
+    """Compile Vue components and JS imports into an ES module with a default export for registering them.
+
+    All paths are relative to the module's location, so it does not depend on the path prefix of the request.
+    """
     builds = [
         vbuild.VBuild(name, component.path.read_text())
         for name, component in vue_components.items()
         if name not in globals.excludes
     ]
-    return (
-        '\n'.join(v.html for v in builds),
-        '<style>' + '\n'.join(v.style for v in builds) + '</style>',
-        '\n'.join(v.script.replace('Vue.component', 'app.component', 1) for v in builds),
-    )
-
-
-def generate_js_imports(prefix: str) -> str:
-    result = ''
+    imports = ''
+    registrations = ''
     for dependency in js_dependencies.values():
         if dependency.optional:
             continue
         if not dependency.dependents.difference(globals.excludes):
             continue
-        result += f'import "{prefix}{dependency.import_path}";\n'
+        imports += f'import "./dependencies/{dependency.id}/{dependency.path.name}";\n'
     for name, component in js_components.items():
         if name in globals.excludes:
             continue
-        result += f'import {{ default as {name} }} from "{prefix}{component.import_path}";\n'
-        result += f'app.component("{name}", {name});\n'
-    return result
+        imports += f'import {{ default as {name} }} from "./components/{component.name}";\n'
+        registrations += f'app.component("{name}", {name});\n'
+    html = '\n'.join(v.html for v in builds) + '<style>' + '\n'.join(v.style for v in builds) + '</style>'
+    scripts = '\n'.join(v.script.replace('Vue.component', 'app.component', 1) for v in builds)
+    return (
+        f'{imports}\n'
+        f'document.body.insertAdjacentHTML("beforeend", {json.dumps(html)});\n'
+        f'export default function (app) {{\n{scripts}\n{registrations}}}\n'
+    )
@@ -1,27 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import warnings
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Union
 
 from typing_extensions import Self
 
 from nicegui import json
 
-from . import binding, events, globals, outbox
+from . import background_tasks, binding, events, globals, outbox
 from .elements.mixins.visibility import Visibility
 from .event_listener import EventListener
+from .props import Props
 from .slot import Slot
 from .tailwind import Tailwind
 
 if TYPE_CHECKING:
     from .client import Client
 
+SERIALIZED_FIELDS = ('class', 'style', 'text', 'slots', 'events')
 PROPS_PATTERN = re.compile(r'([:\w\-]+)(?:=(?:("[^"\\]*(?:\\.[^"\\]*)*")|([\w\-.%:\/]+)))?(?:$|\s)')
 
 
 class Element(Visibility):
+    # NOTE: "__dict__" keeps custom attributes possible; it is only created when such an attribute is assigned
+    __slots__ = ('client', 'id', 'tag', '_classes', '_style', '__props', '_event_listeners', '_text', 'slots',
+                 '_changed_fields', '_serialized', '_stale_fields', 'parent_slot', '_tailwind', '__weakref__', '__dict__')
 
     def __init__(self, tag: str, *, _client: Optional[Client] = None) -> None:
         """Generic Element
@@ -39,11 +45,14 @@ class Element(Visibility):
         self.tag = tag
         self._classes: List[str] = []
         self._style: Dict[str, str] = {}
-        self._props: Dict[str, Any] = {'key': self.id}  # HACK: workaround for #600 and #898
+        self._props = Props({'key': self.id})  # HACK: workaround for #600 and #898
         self._event_listeners: Dict[str, EventListener] = {}
         self._text: Optional[str] = None
         self.slots: Dict[str, Slot] = {}
-        self.default_slot = self.add_slot('default')
+        self._changed_fields: Optional[Set[str]] = None  # NOTE: sets are only created when needed to save memory
+        self._serialized: Optional[Dict[str, Any]] = None
+        self._stale_fields: Optional[Set[str]] = None
+        self._tailwind: Optional[Tailwind] = None
 
         self.client.elements[self.id] = self
         self.parent_slot: Optional[Slot] = None
@@ -52,11 +61,9 @@ class Element(Visibility):
             self.parent_slot = slot_stack[-1]
             self.parent_slot.children.append(self)
 
-        self.tailwind = Tailwind(self)
-
         outbox.enqueue_update(self)
         if self.parent_slot:
-            outbox.enqueue_update(self.parent_slot.parent)
+            self.parent_slot.parent._update_fields('slots')
 
     def add_slot(self, name: str, template: Optional[str] = None) -> Slot:
         """Add a slot to the element.
@@ -65,9 +72,34 @@ class Element(Visibility):
         :param template: Vue template of the slot
         :return: the slot
         """
+        if name != 'default' and 'default' not in self.slots:
+            self.add_slot('default')  # NOTE: keep the default slot first to preserve the order of children
         self.slots[name] = Slot(self, name, template)
+        self._mark_stale('slots')
         return self.slots[name]
 
+    @property
+    def default_slot(self) -> Slot:
+        """The default slot of the element (created on first access)."""
+        if 'default' not in self.slots:
+            self.add_slot('default')
+        return self.slots['default']
+
+    @property
+    def _props(self) -> Props:
+        return self.__props
+
+    @_props.setter
+    def _props(self, props: Dict[str, Any]) -> None:
+        self.__props = props if isinstance(props, Props) else Props(props)
+
+    @property
+    def tailwind(self) -> Tailwind:
+        """Tailwind helper for this element (created on first access)."""
+        if self._tailwind is None:
+            self._tailwind = Tailwind(self)
+        return self._tailwind
+
     def __enter__(self) -> Self:
         self.default_slot.__enter__()
         return self
@@ -81,22 +113,64 @@ class Element(Visibility):
                 yield child
 
     def _collect_slot_dict(self) -> Dict[str, Any]:
+        if 'default' not in self.slots:
+            return {'default': {'template': None, 'ids': []}}  # NOTE: the client renders the text in the default slot
         return {
             name: {'template': slot.template, 'ids': [child.id for child in slot]}
             for name, slot in self.slots.items()
         }
 
+    def _serialize_field(self, field: str) -> Any:
+        if field == 'class':
+            return self._classes
+        if field == 'style':
+            return self._style
+        if field == 'text':
+            return self._text
+        if field == 'slots':
+            return self._collect_slot_dict()
+        if field == 'events':
+            return [listener.to_dict() for listener in self._event_listeners.values()]
+        raise ValueError(f'Unknown field "{field}"')
+
     def _to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'tag': self.tag,
-            'class': self._classes,
-            'style': self._style,
-            'props': self._props,
-            'text': self._text,
-            'slots': self._collect_slot_dict(),
-            'events': [listener.to_dict() for listener in self._event_listeners.values()],
-        }
+        """Return the serialized element.
+
+        The result is cached and only the fields which have been changed since the last call are serialized again.
+        Classes, style and props are contained by reference, so in-place modifications are included automatically.
+        """
+        if self._serialized is None:
+            self._serialized = {
+                'id': self.id,
+                'tag': self.tag,
+                'props': self._props,
+                **{field: self._serialize_field(field) for field in SERIALIZED_FIELDS},
+            }
+        elif self._stale_fields:
+            # NOTE: create a new dictionary because the previous one might still be waiting in a send queue
+            self._serialized = {
+                **self._serialized,
+                **{field: self._serialize_field(field) for field in self._stale_fields},
+            }
+        self._stale_fields = None
+        return self._serialized
+
+    def _to_patch(self) -> Dict[str, Any]:
+        serialized = self._to_dict()
+        patch: Dict[str, Any] = {'id': self.id}
+        for field in SERIALIZED_FIELDS:
+            if self._changed_fields and field in self._changed_fields:
+                patch[field] = serialized[field]
+        if self._props.changed:
+            patch['props'] = {key: self._props[key] for key in self._props.changed}
+        if self._props.removed:
+            patch['removed_props'] = list(self._props.removed)
+        self._reset_changes()
+        return patch
+
+    def _reset_changes(self) -> None:
+        self._changed_fields = None
+        self._props.reset_changes()
 
     @staticmethod
     def _update_classes_list(
@@ -123,7 +197,7 @@ class Element(Visibility):
         new_classes = self._update_classes_list(self._classes, add, remove, replace)
         if self._classes != new_classes:
             self._classes = new_classes
-            self.update()
+            self._update_fields('class')
         return self
 
     @staticmethod
@@ -152,7 +226,7 @@ class Element(Visibility):
         style_dict.update(self._parse_style(replace))
         if self._style != style_dict:
             self._style = style_dict
-            self.update()
+            self._update_fields('style')
         return self
 
     @staticmethod
@@ -187,7 +261,7 @@ class Element(Visibility):
                 needs_update = True
                 self._props[key] = value
         if needs_update:
-            self.update()
+            self._update_fields()
         return self
 
     def tooltip(self, text: str) -> Self:
@@ -207,6 +281,8 @@ class Element(Visibility):
            throttle: float = 0.0,
            leading_events: bool = True,
            trailing_events: bool = True,
+           coalesce: bool = False,
+           cancel_previous: bool = False,
            ) -> Self:
         """Subscribe to an event.
 
@@ -216,6 +292,8 @@ class Element(Visibility):
         :param throttle: minimum time (in seconds) between event occurrences (default: 0.0)
         :param leading_events: whether to trigger the event handler immediately upon the first event occurrence (default: `True`)
         :param trailing_events: whether to trigger the event handler after the last event occurrence (default: `True`)
+        :param coalesce: whether to handle only the latest event which arrives while the handler is still running (default: `False`)
+        :param cancel_previous: whether to cancel async handlers of previous events which are still running (default: `False`)
         """
         if handler:
             if args and '*' in args:
@@ -230,19 +308,60 @@ class Element(Visibility):
                 throttle=throttle,
                 leading_events=leading_events,
                 trailing_events=trailing_events,
+                coalesce=coalesce,
+                cancel_previous=cancel_previous,
             )
             self._event_listeners[listener.id] = listener
-            self.update()
+            self._update_fields('events')
         return self
 
     def _handle_event(self, msg: Dict) -> None:
         listener = self._event_listeners[msg['listener_id']]
-        events.handle_event(listener.handler, msg, sender=self)
+        if listener.coalesce:
+            # NOTE: while the handler is running, newer events replace the waiting one
+            background_tasks.create_lazy(self._handle_event_and_wait(listener, msg), name=f'event {listener.id}')
+        elif listener.cancel_previous:
+            self._dispatch_event(listener, msg)
+        else:
+            events.handle_event(listener.handler, msg,
+                                sender=self, handler_expects_arguments=listener.handler_expects_arguments)
+
+    async def _handle_event_and_wait(self, listener: EventListener, msg: Dict) -> None:
+        tasks = self._dispatch_event(listener, msg)
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def _dispatch_event(self, listener: EventListener, msg: Dict) -> List[asyncio.Task]:
+        with events.collect_handler_tasks() as tasks:
+            events.handle_event(listener.handler, msg,
+                                sender=self, handler_expects_arguments=listener.handler_expects_arguments)
+        if listener.cancel_previous:
+            events.replace_handler_tasks(listener.id, tasks)
+        return tasks
 
     def update(self) -> None:
         """Update the element on the client side."""
+        self._mark_stale(*SERIALIZED_FIELDS)
         outbox.enqueue_update(self)
 
+    def _update_fields(self, *fields: str) -> None:
+        """Send only the given fields and the changed props to the client instead of the whole element.
+
+        :param fields: names of the changed fields ("class", "style", "text", "slots" or "events")
+        """
+        if fields:
+            if self._changed_fields is None:
+                self._changed_fields = set()
+            self._changed_fields.update(fields)
+            self._mark_stale(*fields)
+        outbox.enqueue_patch(self)
+
+    def _mark_stale(self, *fields: str) -> None:
+        """Mark fields which need to be serialized again."""
+        if self._stale_fields is None:
+            self._stale_fields = set()
+        self._stale_fields.update(fields)
+
     def run_method(self, name: str, *args: Any) -> None:
         """Run a method on the client side.
 
@@ -268,7 +387,7 @@ class Element(Visibility):
             del self.client.elements[element.id]
         for slot in self.slots.values():
             slot.children.clear()
-        self.update()
+        self._update_fields('slots')
 
     def move(self, target_container: Optional[Element] = None, target_index: int = -1):
         """Move the element to another container.
@@ -278,12 +397,12 @@ class Element(Visibility):
         """
         assert self.parent_slot is not None
         self.parent_slot.children.remove(self)
-        self.parent_slot.parent.update()
+        self.parent_slot.parent._update_fields('slots')
         target_container = target_container or self.parent_slot.parent
         target_index = target_index if target_index >= 0 else len(target_container.default_slot.children)
         target_container.default_slot.children.insert(target_index, self)
         self.parent_slot = target_container.default_slot
-        target_container.update()
+        target_container._update_fields('slots')
 
     def remove(self, element: Union[Element, int]) -> None:
         """Remove a child element.
@@ -297,7 +416,7 @@ class Element(Visibility):
         del self.client.elements[element.id]
         for slot in self.slots.values():
             slot.children[:] = [e for e in slot if e.id != element.id]
-        self.update()
+        self._update_fields('slots')
 
     def delete(self) -> None:
         """Called when the corresponding client is deleted.
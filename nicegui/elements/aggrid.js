@@ -1,5 +1,9 @@
 export default {
   template: "<div></div>",
+  created() {
+    this.row_requests = new Map();
+    this.next_request_id = 0;
+  },
   mounted() {
     this.update_grid();
   },
@@ -9,8 +13,14 @@ export default {
       this.gridOptions = {
         ...this.options,
         onGridReady: (params) => params.api.sizeColumnsToFit(),
-        getRowId: (params) => params.data.id,
       };
+      if (this.row_source) {
+        // NOTE: rows are requested from the server block by block
+        this.row_requests.clear();
+        this.gridOptions.datasource = { getRows: (params) => this.request_rows(params) };
+      } else {
+        this.gridOptions.getRowId = (params) => params.data.id;
+      }
       for (const column of this.html_columns) {
         if (this.gridOptions.columnDefs[column].cellRenderer === undefined) {
           this.gridOptions.columnDefs[column].cellRenderer = (params) => (params.value ? params.value : "");
@@ -45,6 +55,25 @@ export default {
       this.grid = new agGrid.Grid(this.$el, this.gridOptions);
       this.gridOptions.api.addGlobalListener(this.handle_event);
     },
+    request_rows(params) {
+      const request_id = this.next_request_id++;
+      this.row_requests.set(request_id, params);
+      this.$emit("get_rows", {
+        request_id,
+        start_row: params.startRow,
+        end_row: params.endRow,
+        sort_model: params.sortModel,
+        filter_model: params.filterModel,
+        socket_id: window.socket.id,
+      });
+    },
+    set_rows(request_id, rows, row_count) {
+      const params = this.row_requests.get(request_id);
+      if (!params) return;
+      this.row_requests.delete(request_id);
+      if (rows === null) params.failCallback();
+      else params.successCallback(rows, row_count ?? -1);
+    },
     call_api_method(name, ...args) {
       this.gridOptions.api[name](...args);
     },
@@ -86,5 +115,6 @@ export default {
   props: {
     options: Object,
     html_columns: Array,
+    row_source: Boolean,
   },
 };
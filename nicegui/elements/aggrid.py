@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 
+from .. import globals, json
 from ..dependencies import register_component
 from ..element import Element
 from ..functions.javascript import run_javascript
+from . import aggrid_sources
+from .aggrid_sources import RowRequest, RowResult
 
 register_component('aggrid', __file__, 'aggrid.js', ['lib/ag-grid-enterprise.min.js'])
 
 
 class AgGrid(Element):
+    __slots__ = ('row_source', '_cached_blocks', '_max_cached_blocks')
 
     def __init__(self, options: Dict, *, html_columns: List[int] = [], theme: str = 'balham') -> None:
         """AG Grid
@@ -26,11 +30,17 @@ class AgGrid(Element):
         self._props['options'] = options
         self._props['html_columns'] = html_columns
         self._classes = ['nicegui-aggrid', f'ag-theme-{theme}']
+        self.row_source: Optional[aggrid_sources.RowSource] = None
+        self._cached_blocks: Dict[str, RowResult] = {}
+        self._max_cached_blocks = 0
 
     @staticmethod
     def from_pandas(df: 'pandas.DataFrame', *, theme: str = 'balham') -> AgGrid:
         """Create an AG Grid from a Pandas DataFrame.
 
+        All rows are sent to the client.
+        For large DataFrames use `from_source` instead, which only sends the rows the grid is showing.
+
         :param df: Pandas DataFrame
         :param theme: AG Grid theme (default: 'balham')
         :return: AG Grid
@@ -40,6 +50,67 @@ class AgGrid(Element):
             'rowData': df.to_dict('records'),
         }, theme=theme)
 
+    @staticmethod
+    def from_source(source: Any, *,
+                    options: Dict = {},
+                    html_columns: List[int] = [],
+                    theme: str = 'balham',
+                    max_cached_blocks: int = 100,
+                    ) -> AgGrid:
+        """Create an AG Grid which requests its rows from a data source on the server.
+
+        The grid uses AG Grid's `infinite row model <https://www.ag-grid.com/javascript-data-grid/infinite-scrolling/>`_
+        and requests blocks of rows while scrolling.
+        The source can be a Pandas DataFrame, an async iterable, a function receiving a `RowRequest`
+        or an instance of `RowSource` like `SqliteSource`.
+        Sorting and filtering are passed on to the source.
+        Blocks are cached on the server, so call `refresh()` after the data of the source has changed.
+
+        :param source: data source
+        :param options: dictionary of AG Grid options (column definitions default to the columns of the source)
+        :param html_columns: list of columns that should be rendered as HTML (default: `[]`)
+        :param theme: AG Grid theme (default: 'balham')
+        :param max_cached_blocks: maximum number of blocks which are cached on the server (default: 100)
+        :return: AG Grid
+        """
+        row_source = aggrid_sources.create(source)
+        if 'columnDefs' not in options and row_source.columns is not None:
+            options = {**options, 'columnDefs': [{'field': column} for column in row_source.columns]}
+        grid = AgGrid({'rowModelType': 'infinite', **options}, html_columns=html_columns, theme=theme)
+        grid.row_source = row_source
+        grid._max_cached_blocks = max_cached_blocks
+        grid._props['row_source'] = True
+        grid.on('get_rows', grid._handle_get_rows,
+                ['request_id', 'start_row', 'end_row', 'sort_model', 'filter_model', 'socket_id'])
+        return grid
+
+    async def _handle_get_rows(self, msg: Dict) -> None:
+        args = msg['args']
+        request = RowRequest(start_row=args['start_row'], end_row=args['end_row'],
+                             sort_model=args['sort_model'] or [], filter_model=args['filter_model'] or {})
+        key = json.dumps([request.start_row, request.end_row, request.cache_key])
+        try:
+            result = self._cached_blocks.pop(key, None)
+            if result is None:
+                assert self.row_source is not None
+                result = await self.row_source.get_rows(request)
+            self._cached_blocks[key] = result  # NOTE: re-inserting keeps the most recently used blocks at the end
+            while len(self._cached_blocks) > self._max_cached_blocks:
+                del self._cached_blocks[next(iter(self._cached_blocks))]
+        except Exception:
+            with globals.socket_id(args['socket_id']):
+                self.run_method('set_rows', args['request_id'], None, None)
+            raise
+        with globals.socket_id(args['socket_id']):
+            self.run_method('set_rows', args['request_id'], *result)
+
+    def refresh(self) -> None:
+        """Drop the cached blocks and request the rows of a grid created with `from_source` again."""
+        self._cached_blocks.clear()
+        if self.row_source is not None:
+            self.row_source.clear_cache()
+        self.call_api_method('refreshInfiniteCache')
+
     @property
     def options(self) -> Dict:
         return self._props['options']
@@ -0,0 +1,332 @@
+"""Data sources which answer the row requests of an AG Grid using the infinite row model."""
+import asyncio
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .. import json, run_executor
+from ..helpers import KWONLY_SLOTS, is_data_frame
+
+if TYPE_CHECKING:
+    import pandas
+
+RowResult = Tuple[List[Dict], Optional[int]]  # NOTE: the rows of the block and the total number of rows if known
+
+
+@dataclass(**KWONLY_SLOTS)
+class RowRequest:
+    """Request for a block of rows as sent by AG Grid.
+
+    See `AG Grid's infinite row model <https://www.ag-grid.com/javascript-data-grid/infinite-scrolling/>`_
+    for the format of the sort and filter models.
+    """
+    start_row: int
+    end_row: int
+    sort_model: List[Dict]
+    filter_model: Dict[str, Dict]
+
+    @property
+    def cache_key(self) -> str:
+        """Key identifying the sorting and filtering of this request."""
+        return json.dumps([self.sort_model, self.filter_model], sort_keys=True)
+
+
+class RowSource(ABC):
+    """Base class for data sources of an AG Grid.
+
+    Subclasses implement `get_rows` which returns the requested rows and the total number of rows,
+    or `None` if the total number is not known yet.
+    """
+
+    @property
+    def columns(self) -> Optional[List[str]]:
+        """Names of the columns if they are known in advance."""
+        return None
+
+    @abstractmethod
+    async def get_rows(self, request: RowRequest) -> RowResult:
+        """Return the requested rows and the total number of rows or `None` if it is not known yet."""
+
+    def clear_cache(self) -> None:
+        """Forget cached results, e.g. after the data has changed."""
+
+
+class DataFrameSource(RowSource):
+
+    def __init__(self, df: 'pandas.DataFrame') -> None:
+        """Pandas DataFrame as AG Grid data source
+
+        Sorting and filtering is done on the DataFrame in a separate thread.
+        The result is kept until another sorting or filtering is requested, so scrolling only slices the DataFrame.
+
+        :param df: Pandas DataFrame
+        """
+        self.df = df
+        self._ordered: Optional[Tuple[str, 'pandas.DataFrame']] = None
+        self._version = 0  # NOTE: incremented by `clear_cache` so that results of outdated requests are not cached
+
+    @property
+    def columns(self) -> List[str]:
+        return [str(column) for column in self.df.columns]
+
+    async def get_rows(self, request: RowRequest) -> RowResult:
+        cache_key = request.cache_key
+        if self._ordered is not None and self._ordered[0] == cache_key:
+            df = self._ordered[1]
+        else:
+            version = self._version
+            df = await run_executor.io_bound(self._order, request)
+            # NOTE: concurrent requests with other sortings or filters might have replaced the cache in the meantime
+            if version == self._version and (self._ordered is None or self._ordered[0] != cache_key):
+                self._ordered = (cache_key, df)
+        return df.iloc[request.start_row:request.end_row].to_dict('records'), len(df)
+
+    def clear_cache(self) -> None:
+        self._ordered = None
+        self._version += 1
+
+    def _order(self, request: RowRequest) -> 'pandas.DataFrame':
+        df = self.df
+        for column, model in request.filter_model.items():
+            df = df[_filter_series(df[_get_column(df.columns, column)], model)]
+        if request.sort_model:
+            df = df.sort_values([_get_column(df.columns, sort['colId']) for sort in request.sort_model],
+                                ascending=[sort['sort'] == 'asc' for sort in request.sort_model],
+                                kind='stable')
+        return df
+
+
+class SqliteSource(RowSource):
+
+    def __init__(self,
+                 connection: Union[sqlite3.Connection, sqlite3.Cursor],
+                 query: str,
+                 parameters: Sequence[Any] = (),
+                 ) -> None:
+        """SQLite query as AG Grid data source
+
+        Sorting, filtering and slicing are pushed down to the database by wrapping the query.
+        Only columns of the query can be used for sorting and filtering, and all values are passed as parameters.
+        The number of rows is counted once per filter.
+        The queries run in a separate thread, so the connection must be created with `check_same_thread=False`.
+
+        :param connection: SQLite connection or a cursor whose connection is used
+        :param query: SELECT statement or name of a table
+        :param parameters: parameters of the query
+        """
+        self.connection = connection.connection if isinstance(connection, sqlite3.Cursor) else connection
+        is_select = query.lstrip().upper().startswith(('SELECT', 'WITH'))
+        self.query = query if is_select else f'SELECT * FROM {_quote(query)}'
+        self.parameters = list(parameters)
+        description = self.connection.execute(f'SELECT * FROM ({self.query}) LIMIT 0', self.parameters).description
+        self._columns = [column[0] for column in description]
+        self._counts: Dict[str, int] = {}
+        self._version = 0  # NOTE: incremented by `clear_cache` so that counts of outdated requests are not cached
+        self._lock = threading.Lock()  # NOTE: the connection must not be used by multiple threads at the same time
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    async def get_rows(self, request: RowRequest) -> RowResult:
+        count_key = json.dumps(request.filter_model, sort_keys=True)
+        version = self._version
+        rows, count = await run_executor.io_bound(self._query, request, self._counts.get(count_key))
+        if version == self._version:
+            self._counts[count_key] = count
+        return rows, count
+
+    def clear_cache(self) -> None:
+        self._counts.clear()
+        self._version += 1
+
+    def _query(self, request: RowRequest, count: Optional[int]) -> Tuple[List[Dict], int]:
+        conditions: List[str] = []
+        parameters = list(self.parameters)
+        for column, model in request.filter_model.items():
+            condition, condition_parameters = _filter_sql(_quote(_get_column(self._columns, column)), model)
+            conditions.append(condition)
+            parameters.extend(condition_parameters)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        order = ', '.join(_quote(_get_column(self._columns, sort['colId'])) + ('' if sort['sort'] == 'asc' else ' DESC')
+                          for sort in request.sort_model)
+        order_by = f' ORDER BY {order}' if order else ''
+        limit = [request.end_row - request.start_row, request.start_row]
+        with self._lock:
+            if count is None:
+                count = self.connection.execute(f'SELECT COUNT(*) FROM ({self.query}){where}', parameters).fetchone()[0]
+            query = f'SELECT * FROM ({self.query}){where}{order_by} LIMIT ? OFFSET ?'
+            cursor = self.connection.execute(query, parameters + limit)
+            rows = [dict(zip(self._columns, row)) for row in cursor.fetchall()]
+        return rows, count
+
+
+class AsyncIterableSource(RowSource):
+
+    def __init__(self, rows: AsyncIterable[Dict]) -> None:
+        """Async iterable as AG Grid data source
+
+        The rows are consumed as far as the grid is scrolled and are kept in memory,
+        so scrolling back does not need to restart the iteration.
+        Sorting and filtering are not supported.
+
+        :param rows: async iterable (e.g. an async generator) yielding the rows
+        """
+        self._iterator = rows.__aiter__()
+        self._rows: List[Dict] = []
+        self._exhausted = False
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get_rows(self, request: RowRequest) -> RowResult:
+        if request.sort_model or request.filter_model:
+            raise ValueError('Async iterables do not support sorting or filtering')
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:  # NOTE: concurrent requests must not consume the iterator at the same time
+            while not self._exhausted and len(self._rows) < request.end_row:
+                try:
+                    self._rows.append(await self._iterator.__anext__())
+                except StopAsyncIteration:
+                    self._exhausted = True
+        return self._rows[request.start_row:request.end_row], len(self._rows) if self._exhausted else None
+
+
+class FunctionSource(RowSource):
+
+    def __init__(self, func: Callable[[RowRequest], Union[RowResult, Awaitable[RowResult]]]) -> None:
+        """Function as AG Grid data source
+
+        :param func: function (which may be async) receiving a `RowRequest` and returning the rows and the row count
+        """
+        self.func = func
+
+    async def get_rows(self, request: RowRequest) -> RowResult:
+        result = self.func(request)
+        return await result if isawaitable(result) else result
+
+
+def create(source: Any) -> RowSource:
+    """Wrap DataFrames, async iterables and functions into a `RowSource`."""
+    if isinstance(source, RowSource):
+        return source
+    if is_data_frame(source):
+        return DataFrameSource(source)
+    if hasattr(source, '__aiter__'):
+        return AsyncIterableSource(source)
+    if callable(source):
+        return FunctionSource(source)
+    raise TypeError(f'Unsupported AG Grid data source: {type(source).__name__}')
+
+
+def _get_column(columns: Sequence[Any], name: str) -> Any:
+    for column in columns:
+        if str(column) == name:
+            return column
+    raise ValueError(f'Unknown column "{name}"')
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _get_conditions(model: Dict) -> List[Dict]:
+    return model.get('conditions') or [model['condition1'], model['condition2']]
+
+
+def _filter_series(series: 'pandas.Series', model: Dict) -> 'pandas.Series':
+    """Translate an AG Grid column filter into a boolean mask."""
+    if 'operator' in model:
+        masks = [_filter_series(series, condition) for condition in _get_conditions(model)]
+        result = masks[0]
+        for mask in masks[1:]:
+            result = result & mask if model['operator'] == 'AND' else result | mask
+        return result
+    filter_type = model.get('filterType')
+    type_ = model.get('type')
+    if filter_type == 'set':
+        return series.isin(model['values'])
+    if type_ == 'blank':
+        return series.isna() | (series.astype(str) == '')
+    if type_ == 'notBlank':
+        return series.notna() & (series.astype(str) != '')
+    if filter_type == 'text':
+        text = series.astype(str).str.lower()
+        search = str(model.get('filter', '')).lower()
+        if type_ == 'contains':
+            return text.str.contains(search, regex=False)
+        if type_ == 'notContains':
+            return ~text.str.contains(search, regex=False)
+        if type_ == 'equals':
+            return text == search
+        if type_ == 'notEqual':
+            return text != search
+        if type_ == 'startsWith':
+            return text.str.startswith(search)
+        if type_ == 'endsWith':
+            return text.str.endswith(search)
+    if filter_type == 'number':
+        value = model.get('filter')
+        if type_ == 'equals':
+            return series == value
+        if type_ == 'notEqual':
+            return series != value
+        if type_ == 'lessThan':
+            return series < value
+        if type_ == 'lessThanOrEqual':
+            return series <= value
+        if type_ == 'greaterThan':
+            return series > value
+        if type_ == 'greaterThanOrEqual':
+            return series >= value
+        if type_ == 'inRange':
+            return (series > value) & (series < model.get('filterTo'))
+    raise ValueError(f'Unsupported filter: {model}')
+
+
+def _filter_sql(column: str, model: Dict) -> Tuple[str, List[Any]]:
+    """Translate an AG Grid column filter into an SQL condition and its parameters."""
+    if 'operator' in model:
+        operator = ' AND ' if model['operator'] == 'AND' else ' OR '
+        conditions = [_filter_sql(column, condition) for condition in _get_conditions(model)]
+        return '(' + operator.join(sql for sql, _ in conditions) + ')', [p for _, params in conditions for p in params]
+    filter_type = model.get('filterType')
+    type_ = model.get('type')
+    if filter_type == 'set':
+        return f'{column} IN ({", ".join("?" for _ in model["values"])})', list(model['values'])
+    if type_ == 'blank':
+        return f"({column} IS NULL OR {column} = '')", []
+    if type_ == 'notBlank':
+        return f"({column} IS NOT NULL AND {column} != '')", []
+    if filter_type == 'text':
+        value = str(model.get('filter', ''))
+        pattern = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        patterns = {
+            'contains': f'%{pattern}%',
+            'notContains': f'%{pattern}%',
+            'startsWith': f'{pattern}%',
+            'endsWith': f'%{pattern}',
+        }
+        if type_ in patterns:
+            negation = 'NOT ' if type_ == 'notContains' else ''
+            return f"{column} {negation}LIKE ? ESCAPE '\\'", [patterns[type_]]
+        if type_ == 'equals':
+            return f'LOWER({column}) = LOWER(?)', [value]
+        if type_ == 'notEqual':
+            return f'LOWER({column}) != LOWER(?)', [value]
+    if filter_type == 'number':
+        operators = {
+            'equals': '=',
+            'notEqual': '!=',
+            'lessThan': '<',
+            'lessThanOrEqual': '<=',
+            'greaterThan': '>',
+            'greaterThanOrEqual': '>=',
+        }
+        if type_ in operators:
+            return f'{column} {operators[type_]} ?', [model.get('filter')]
+        if type_ == 'inRange':
+            return f'({column} > ? AND {column} < ?)', [model.get('filter'), model.get('filterTo')]
+    raise ValueError(f'Unsupported filter: {model}')
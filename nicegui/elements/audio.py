@@ -7,7 +7,6 @@ register_component('audio', __file__, 'audio.js')
 
 
 class Audio(Element):
-
     def __init__(self, src: str, *,
                  controls: bool = True,
                  autoplay: bool = False,
@@ -5,7 +5,6 @@ from ..element import Element
 
 
 class Avatar(Element):
-
     def __init__(self,
                  icon: Optional[str] = None, *,
                  color: Optional[str] = 'primary',
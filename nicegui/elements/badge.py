@@ -5,7 +5,6 @@ from .mixins.text_element import TextElement
 
 
 class Badge(TextElement):
-
     def __init__(self,
                  text: str = '', *,
                  color: Optional[str] = 'primary',
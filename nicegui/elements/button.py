@@ -8,7 +8,6 @@ from .mixins.text_element import TextElement
 
 
 class Button(TextElement, DisableableElement):
-
     def __init__(self,
                  text: str = '', *,
                  on_click: Optional[Callable[..., Any]] = None,
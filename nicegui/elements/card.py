@@ -2,7 +2,6 @@ from ..element import Element
 
 
 class Card(Element):
-
     def __init__(self) -> None:
         """Card
 
@@ -26,12 +25,10 @@ class Card(Element):
 
 
 class CardSection(Element):
-
     def __init__(self) -> None:
         super().__init__('q-card-section')
 
 
 class CardActions(Element):
-
     def __init__(self) -> None:
         super().__init__('q-card-actions')
@@ -83,7 +83,6 @@ register_component('chart', __file__, 'chart.js', dependencies, optional_depende
 
 
 class Chart(Element):
-
     def __init__(self, options: Dict, *, type: str = 'chart', extras: List[str] = []) -> None:
         """Chart
 
@@ -8,7 +8,6 @@ register_component('chat_message', __file__, 'chat_message.js')
 
 
 class ChatMessage(Element):
-
     def __init__(self,
                  text: Union[str, List[str]], *,
                  name: Optional[str] = None,
@@ -4,6 +4,7 @@ from .mixins.value_element import ValueElement
 
 
 class ChoiceElement(ValueElement):
+    __slots__ = ('options', '_values', '_labels')
 
     def __init__(self, *,
                  tag: str,
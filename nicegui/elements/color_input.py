@@ -8,6 +8,7 @@ from .mixins.value_element import ValueElement
 
 
 class ColorInput(ValueElement, DisableableElement):
+    __slots__ = ('button', 'picker')
     LOOPBACK = False
 
     def __init__(self,
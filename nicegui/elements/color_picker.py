@@ -7,6 +7,7 @@ from .menu import Menu
 
 
 class ColorPicker(Menu):
+    __slots__ = ('q_color',)
 
     def __init__(self, *, on_pick: Callable[..., Any], value: bool = False) -> None:
         """Color Picker
@@ -5,7 +5,6 @@ register_component('colors', __file__, 'colors.js')
 
 
 class Colors(Element):
-
     def __init__(self, *,
                  primary='#5898d4',
                  secondary='#26a69a',
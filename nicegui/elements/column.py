@@ -2,7 +2,6 @@ from ..element import Element
 
 
 class Column(Element):
-
     def __init__(self) -> None:
         '''Column Element
 
@@ -5,6 +5,7 @@ from .mixins.value_element import ValueElement
 
 
 class Dialog(ValueElement):
+    __slots__ = ('_result', '_submitted')
 
     def __init__(self, *, value: bool = False) -> None:
         """Dialog
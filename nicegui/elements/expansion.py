@@ -5,7 +5,6 @@ from .mixins.value_element import ValueElement
 
 
 class Expansion(ValueElement, DisableableElement):
-
     def __init__(self, text: Optional[str] = None, *, icon: Optional[str] = None, value: bool = False) -> None:
         '''Expansion Element
 
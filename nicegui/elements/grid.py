@@ -4,7 +4,6 @@ from ..element import Element
 
 
 class Grid(Element):
-
     def __init__(self,
                  rows: Optional[int] = None,
                  columns: Optional[int] = None,
@@ -2,7 +2,6 @@ from .mixins.content_element import ContentElement
 
 
 class Html(ContentElement):
-
     def __init__(self, content: str = '') -> None:
         """HTML Element
 
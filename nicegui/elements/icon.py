@@ -5,7 +5,6 @@ from ..element import Element
 
 
 class Icon(Element):
-
     def __init__(self,
                  name: str,
                  *,
@@ -2,7 +2,6 @@ from .mixins.source_element import SourceElement
 
 
 class Image(SourceElement):
-
     def __init__(self, source: str = '') -> None:
         """Image
 
@@ -6,6 +6,7 @@ from .mixins.value_element import ValueElement
 
 
 class Input(ValueElement, DisableableElement):
+    __slots__ = ('validation',)
     LOOPBACK = False
 
     def __init__(self,
@@ -15,6 +16,7 @@ class Input(ValueElement, DisableableElement):
                  password: bool = False,
                  password_toggle_button: bool = False,
                  on_change: Optional[Callable[..., Any]] = None,
+                 cancel_previous: bool = False,
                  autocomplete: Optional[List[str]] = None,
                  validation: Dict[str, Callable[..., bool]] = {}) -> None:
         """Text Input
@@ -34,10 +36,11 @@ class Input(ValueElement, DisableableElement):
         :param password: whether to hide the input (default: False)
         :param password_toggle_button: whether to show a button to toggle the password visibility (default: False)
         :param on_change: callback to execute when the value changes
+        :param cancel_previous: whether to cancel a still running async `on_change` callback when the user changes the value again (default: `False`)
         :param autocomplete: optional list of strings for autocompletion
         :param validation: dictionary of validation rules, e.g. ``{'Too short!': lambda value: len(value) < 3}``
         """
-        super().__init__(tag='q-input', value=value, on_value_change=on_change)
+        super().__init__(tag='q-input', value=value, on_value_change=on_change, cancel_previous=cancel_previous)
         if label is not None:
             self._props['label'] = label
         if placeholder is not None:
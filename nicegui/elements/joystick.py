@@ -8,7 +8,6 @@ register_component('joystick', __file__, 'joystick.vue', ['lib/nipplejs.min.js']
 
 
 class Joystick(Element):
-
     def __init__(self, *,
                  on_start: Optional[Callable[..., Any]] = None,
                  on_move: Optional[Callable[..., Any]] = None,
@@ -11,6 +11,7 @@ register_component('keyboard', __file__, 'keyboard.js')
 
 
 class Keyboard(Element):
+    __slots__ = ('key_handler', '_bindable_active')
     active = BindableProperty()
 
     def __init__(self,
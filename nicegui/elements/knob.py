@@ -7,6 +7,7 @@ from .mixins.value_element import ValueElement
 
 
 class Knob(ValueElement, DisableableElement):
+    __slots__ = ('label',)
 
     def __init__(self,
                  value: float = 0.0,
@@ -4,6 +4,7 @@ from .pyplot import Pyplot
 
 
 class LinePlot(Pyplot):
+    __slots__ = ('x', 'Y', 'lines', 'slice', 'update_every', 'push_counter')
 
     def __init__(self, *,
                  n: int = 1,
@@ -9,7 +9,6 @@ register_component('link', __file__, 'link.js')
 
 
 class Link(TextElement):
-
     def __init__(self,
                  text: str = '',
                  target: Union[Callable[..., Any], str, Element] = '#',
@@ -38,7 +37,6 @@ class Link(TextElement):
 
 
 class LinkTarget(Element):
-
     def __init__(self, name: str) -> None:
         """Link target
 
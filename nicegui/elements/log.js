@@ -1,37 +1,129 @@
+const MAX_HEIGHT = 10000000; // NOTE: browsers limit the height of elements, so the scroll position of longer logs is scaled
+const CHUNK_SIZE = 500;
+const CACHE_SIZE = 10000;
+
 export default {
-  template: "<textarea disabled></textarea>",
+  template: `
+    <div @scroll="render">
+      <div :style="{position: 'relative', height: height + 'px'}">
+        <div
+          v-for="row in rows"
+          :key="row.index"
+          :style="{position: 'absolute', top: row.top + 'px', height: rowHeight + 'px'}"
+        >{{ row.text }}</div>
+      </div>
+    </div>
+  `,
   data() {
     return {
-      num_lines: 0,
+      rows: [],
+      height: 0,
+      rowHeight: 20,
     };
   },
+  created() {
+    // NOTE: the history is not reactive, because only the rendered rows need to be tracked by Vue
+    this.cache = new Map();
+    this.requests = new Set();
+    this.end = this.end_index;
+    this.first = this.end_index - this.num_lines;
+    const start = this.end - this.lines.length;
+    this.lines.forEach((line, i) => this.cache.set(start + i, decodeURIComponent(line)));
+  },
   mounted() {
-    const text = decodeURIComponent(this.lines);
-    this.$el.innerHTML = text;
-    this.num_lines = text ? text.split("\n").length : 0;
+    const probe = document.createElement("div");
+    probe.textContent = "X";
+    this.$el.appendChild(probe);
+    this.rowHeight = probe.offsetHeight || this.rowHeight;
+    this.$el.removeChild(probe);
+    this.resizeObserver = new ResizeObserver(() => this.render());
+    this.resizeObserver.observe(this.$el);
+    this.refresh(true);
+  },
+  unmounted() {
+    this.resizeObserver.disconnect();
   },
   methods: {
-    push(line) {
-      const decoded = decodeURIComponent(line);
-      const textarea = this.$el;
-      textarea.innerHTML += (this.num_lines ? "\n" : "") + decoded;
-      textarea.scrollTop = textarea.scrollHeight;
-      this.num_lines += decoded.split("\n").length;
-      while (this.max_lines && this.num_lines > this.max_lines) {
-        const index = textarea.innerHTML.indexOf("\n");
-        if (index == -1) break;
-        textarea.innerHTML = textarea.innerHTML.slice(index + 1);
-        this.num_lines -= 1;
+    push(lines, end) {
+      const start = end - lines.length;
+      lines.forEach((line, i) => this.cache.set(start + i, line));
+      this.end = end;
+      if (this.max_lines) this.drop(this.end - this.max_lines);
+      this.refresh(this.isAtBottom());
+    },
+    clear(end) {
+      this.cache.clear();
+      this.requests.clear();
+      this.first = this.end = end;
+      this.refresh(true);
+    },
+    addHistory(requestStart, start, lines) {
+      this.requests.delete(requestStart);
+      if (start > requestStart) this.drop(start); // NOTE: the server does not have older lines anymore
+      lines.forEach((line, i) => this.cache.set(start + i, line));
+      this.render();
+    },
+    drop(first) {
+      if (first <= this.first) return;
+      if (first - this.first > this.cache.size) {
+        for (const index of this.cache.keys()) if (index < first) this.cache.delete(index);
+      } else {
+        for (let index = this.first; index < first; index++) this.cache.delete(index);
       }
+      this.first = first;
+    },
+    isAtBottom() {
+      const el = this.$el;
+      return el.scrollTop + el.clientHeight >= el.scrollHeight - 1;
     },
-    clear() {
-      const textarea = this.$el;
-      textarea.innerHTML = "";
-      this.num_lines = 0;
+    refresh(scrollToBottom) {
+      this.height = Math.min((this.end - this.first) * this.rowHeight, MAX_HEIGHT);
+      this.$nextTick(() => {
+        if (scrollToBottom) this.$el.scrollTop = this.$el.scrollHeight;
+        this.render();
+      });
+    },
+    render() {
+      const el = this.$el;
+      const count = this.end - this.first;
+      const totalHeight = count * this.rowHeight;
+      const maxScroll = Math.max(this.height - el.clientHeight, 0);
+      const scrollTop = Math.min(el.scrollTop, maxScroll);
+      const virtualTop = maxScroll > 0 ? (scrollTop / maxScroll) * (totalHeight - el.clientHeight) : 0;
+      const firstRow = Math.floor(virtualTop / this.rowHeight);
+      const lastRow = Math.min(firstRow + Math.ceil(el.clientHeight / this.rowHeight) + 1, count);
+      const rows = [];
+      for (let row = firstRow; row < lastRow; row++) {
+        const index = this.first + row;
+        rows.push({ index, top: scrollTop + row * this.rowHeight - virtualTop, text: this.cache.get(index) });
+      }
+      this.rows = rows;
+      this.fetch(rows);
+      this.trimCache(this.first + firstRow, this.first + lastRow);
+    },
+    fetch(rows) {
+      rows
+        .filter((row) => row.text === undefined)
+        .forEach((row) => {
+          const start = Math.max(Math.floor(row.index / CHUNK_SIZE) * CHUNK_SIZE, this.first);
+          if (this.requests.has(start)) return;
+          this.requests.add(start);
+          this.$emit("history", { start, end: start + CHUNK_SIZE, socket_id: window.socket.id });
+        });
+    },
+    trimCache(start, end) {
+      if (this.cache.size <= CACHE_SIZE) return;
+      for (const index of this.cache.keys()) {
+        const nearView = index >= start - CACHE_SIZE / 4 && index < end + CACHE_SIZE / 4;
+        const nearEnd = index >= this.end - CACHE_SIZE / 4;
+        if (!nearView && !nearEnd) this.cache.delete(index);
+      }
     },
   },
   props: {
     max_lines: Number,
-    lines: String,
+    lines: Array,
+    end_index: Number,
+    num_lines: Number,
   },
 };
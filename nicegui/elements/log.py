@@ -1,7 +1,9 @@
 import urllib.parse
 from collections import deque
-from typing import Any, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
+from .. import globals, outbox
 from ..dependencies import register_component
 from ..element import Element
 
@@ -9,28 +11,78 @@ register_component('log', __file__, 'log.js')
 
 
 class Log(Element):
+    __slots__ = ('lines', '_end_index', '_lines_changed', '_pending_lines')
+    TAIL_LINES = 500  # NOTE: lines which are sent when rendering the page; older lines are fetched when scrolling up
+    CHUNK_SIZE = 500  # NOTE: maximum number of lines which are sent upon a history request
 
     def __init__(self, max_lines: Optional[int] = None) -> None:
         """Log view
 
         Create a log view that allows to add new lines without re-transmitting the whole history to the client.
+        Lines which are pushed in quick succession are sent to the client in a single message.
+        Only the visible lines are rendered in the browser and older lines are fetched from the server when scrolling up,
+        so even long histories do not slow down the page.
 
         :param max_lines: maximum number of lines before dropping oldest ones (default: `None`)
         """
         super().__init__('log')
         self._props['max_lines'] = max_lines
-        self._props['lines'] = ''
+        self._props['lines'] = []
+        self._props['end_index'] = 0
+        self._props['num_lines'] = 0
         self._classes = ['nicegui-log']
-        self.lines: deque[str] = deque(maxlen=max_lines)
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self._end_index = 0  # NOTE: absolute index after the last line, which is not affected by dropping old lines
+        self._lines_changed = False
+        self._pending_lines: List[str] = []
+        self.on('history', self._handle_history_request, ['start', 'end', 'socket_id'])
 
     def push(self, line: Any) -> None:
-        self.lines.extend(map(urllib.parse.quote, str(line).splitlines()))
-        self._props['lines'] = '\n'.join(self.lines)
-        self.run_method('push', urllib.parse.quote(str(line)))
+        new_lines = str(line).splitlines() or ['']
+        self.lines.extend(new_lines)
+        self._end_index += len(new_lines)
+        self._lines_changed = True
+        if not self._pending_lines:
+            outbox.enqueue_flush_callback(self._push_pending_lines)
+        self._pending_lines.extend(new_lines)
+        if len(self._pending_lines) > self.TAIL_LINES:
+            del self._pending_lines[:-self.TAIL_LINES]  # NOTE: the client fetches skipped lines when scrolling up
+
+    def _push_pending_lines(self) -> None:
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        self.run_method('push', lines, self._end_index)
+
+    def _get_lines(self, start: int, end: int) -> List[str]:
+        """Return a slice of the lines, iterating from the closer end of the deque."""
+        if start > len(self.lines) // 2:
+            return list(islice(reversed(self.lines), len(self.lines) - end, len(self.lines) - start))[::-1]
+        return list(islice(self.lines, start, end))
+
+    def _handle_history_request(self, msg: Dict) -> None:
+        args = msg['args']
+        first_index = self._end_index - len(self.lines)
+        start = max(args['start'], first_index)
+        end = min(args['end'], start + self.CHUNK_SIZE, self._end_index)
+        lines = self._get_lines(start - first_index, end - first_index) if start < end else []
+        with globals.socket_id(args['socket_id']):
+            self.run_method('addHistory', args['start'], start, lines)
+
+    def _to_dict(self) -> Dict[str, Any]:
+        if self._lines_changed:
+            # NOTE: the tail is only needed when the element is rendered, so it is not tracked as a changed prop
+            tail = self._get_lines(max(len(self.lines) - self.TAIL_LINES, 0), len(self.lines))
+            dict.__setitem__(self._props, 'lines', [urllib.parse.quote(line) for line in tail])
+            dict.__setitem__(self._props, 'end_index', self._end_index)
+            dict.__setitem__(self._props, 'num_lines', len(self.lines))
+            self._lines_changed = False
+        return super()._to_dict()
 
     def clear(self) -> None:
         """Clear the log"""
         super().clear()
-        self._props['lines'] = ''
         self.lines.clear()
-        self.run_method('clear')
+        self._pending_lines.clear()
+        self._lines_changed = True
+        self.run_method('clear', self._end_index)
@@ -7,7 +7,6 @@ from .mixins.value_element import ValueElement
 
 
 class Menu(ValueElement):
-
     def __init__(self, *, value: bool = False) -> None:
         """Menu
 
@@ -27,6 +26,7 @@ class Menu(ValueElement):
 
 
 class MenuItem(TextElement):
+    __slots__ = ('menu',)
 
     def __init__(self,
                  text: str = '',
@@ -7,6 +7,7 @@ from ...element import Element
 
 
 class ContentElement(Element):
+    __slots__ = ()
     CONTENT_PROP = 'innerHTML'
     content = BindableProperty(on_change=lambda sender, content: sender.on_content_change(content))
 
@@ -80,4 +81,4 @@ class ContentElement(Element):
         if self.CONTENT_PROP == 'innerHTML' and '</script>' in content:
             raise ValueError('HTML elements must not contain <script> tags. Use ui.add_body_html() instead.')
         self._props[self.CONTENT_PROP] = content
-        self.update()
+        self._update_fields()
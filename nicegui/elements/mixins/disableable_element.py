@@ -7,6 +7,7 @@ from ...element import Element
 
 
 class DisableableElement(Element):
+    __slots__ = ()
     enabled = BindableProperty(on_change=lambda sender, value: sender.on_enabled_change(value))
 
     def __init__(self, **kwargs: Any) -> None:
@@ -81,4 +82,4 @@ class DisableableElement(Element):
         :param enabled: The new state.
         """
         self._props['disable'] = not enabled
-        self.update()
+        self._update_fields()
@@ -7,6 +7,7 @@ from ...element import Element
 
 
 class FilterElement(Element):
+    __slots__ = ()
     FILTER_PROP = 'filter'
     filter = BindableProperty(on_change=lambda sender, filter: sender.on_filter_change(filter))
 
@@ -78,4 +79,4 @@ class FilterElement(Element):
         :param filter: The new filter.
         """
         self._props[self.FILTER_PROP] = filter
-        self.update()
+        self._update_fields()
@@ -7,6 +7,7 @@ from ...element import Element
 
 
 class SourceElement(Element):
+    __slots__ = ()
     source = BindableProperty(on_change=lambda sender, source: sender.on_source_change(source))
 
     def __init__(self, *, source: str, **kwargs: Any) -> None:
@@ -77,4 +78,4 @@ class SourceElement(Element):
         :param source: The new source.
         """
         self._props['src'] = source
-        self.update()
+        self._update_fields()
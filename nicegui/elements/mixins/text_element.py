@@ -7,6 +7,7 @@ from ...element import Element
 
 
 class TextElement(Element):
+    __slots__ = ()
     text = BindableProperty(on_change=lambda sender, text: sender.on_text_change(text))
 
     def __init__(self, *, text: str, **kwargs: Any) -> None:
@@ -77,7 +78,7 @@ class TextElement(Element):
         :param text: The new text.
         """
         self._text_to_model_text(text)
-        self.update()
+        self._update_fields('text')
 
     def _text_to_model_text(self, text: str) -> None:
         self._text = text
@@ -8,6 +8,7 @@ from ...events import ValueChangeEventArguments, handle_event
 
 
 class ValueElement(Element):
+    __slots__ = ('_send_update_on_value_change', 'change_handler')
     VALUE_PROP: str = 'model-value'
     EVENT_ARGS: Optional[List[str]] = ['value']
     LOOPBACK: bool = True
@@ -17,6 +18,7 @@ class ValueElement(Element):
                  value: Any,
                  on_value_change: Optional[Callable[..., Any]],
                  throttle: float = 0,
+                 cancel_previous: bool = False,
                  **kwargs: Any,
                  ) -> None:
         super().__init__(**kwargs)
@@ -30,7 +32,8 @@ class ValueElement(Element):
             self._send_update_on_value_change = self.LOOPBACK
             self.set_value(self._msg_to_value(msg))
             self._send_update_on_value_change = True
-        self.on(f'update:{self.VALUE_PROP}', handle_change, self.EVENT_ARGS, throttle=throttle)
+        self.on(f'update:{self.VALUE_PROP}', handle_change, self.EVENT_ARGS,
+                throttle=throttle, cancel_previous=cancel_previous)
 
     def bind_value_to(self,
                       target_object: Any,
@@ -96,7 +99,7 @@ class ValueElement(Element):
         """
         self._props[self.VALUE_PROP] = self._value_to_model_value(value)
         if self._send_update_on_value_change:
-            self.update()
+            self._update_fields()
         args = ValueChangeEventArguments(sender=self, client=self.client, value=self._value_to_event_value(value))
         handle_event(self.change_handler, args)
 
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 
 class Visibility:
+    __slots__ = ('_bindable_visible',)
     visible = BindableProperty(on_change=lambda sender, visible: sender.on_visibility_change(visible))
 
     def __init__(self, **kwargs: Any) -> None:
@@ -87,7 +88,7 @@ class Visibility:
         self = cast('Element', self)
         if visible and 'hidden' in self._classes:
             self._classes.remove('hidden')
-            self.update()
+            self._update_fields('class')
         if not visible and 'hidden' not in self._classes:
             self._classes.append('hidden')
-            self.update()
+            self._update_fields('class')
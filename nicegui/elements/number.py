@@ -5,6 +5,7 @@ from .mixins.value_element import ValueElement
 
 
 class Number(ValueElement, DisableableElement):
+    __slots__ = ('format', 'validation')
     LOOPBACK = False
 
     def __init__(self,
@@ -9,6 +9,7 @@ register_component('plotly', __file__, 'plotly.vue', [], ['lib/plotly.min.js'])
 
 
 class Plotly(Element):
+    __slots__ = ('figure',)
 
     def __init__(self, figure: Union[Dict, go.Figure]) -> None:
         """Plotly Element
@@ -1,14 +1,14 @@
-import asyncio
 import io
 from typing import Any
 
 import matplotlib.pyplot as plt
 
-from .. import background_tasks, globals
+from .. import background_tasks
 from ..element import Element
 
 
 class Pyplot(Element):
+    __slots__ = ('close', 'fig')
 
     def __init__(self, *, close: bool = True, **kwargs: Any) -> None:
         """Pyplot Context
@@ -42,6 +42,5 @@ class Pyplot(Element):
         self.update()
 
     async def _auto_close(self) -> None:
-        while self.client.id in globals.clients:
-            await asyncio.sleep(1.0)
+        await self.client.disconnected()
         plt.close(self.fig)
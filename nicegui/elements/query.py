@@ -10,7 +10,6 @@ register_component('query', __file__, 'query.js')
 
 
 class Query(Element):
-
     def __init__(self, selector: str) -> None:
         super().__init__('query')
         self._props['selector'] = selector
@@ -2,7 +2,6 @@ from ..element import Element
 
 
 class Row(Element):
-
     def __init__(self) -> None:
         '''Row Element
 
@@ -37,6 +37,7 @@ class SceneObject:
 
 
 class Scene(Element):
+    __slots__ = ('camera', 'is_initialized', 'objects', 'on_click', 'stack')
     from .scene_objects import Box as box
     from .scene_objects import Curve as curve
     from .scene_objects import Cylinder as cylinder
@@ -11,6 +11,7 @@ register_component('select', __file__, 'select.js')
 
 
 class Select(ChoiceElement, DisableableElement):
+    __slots__ = ('original_options',)
 
     def __init__(self, options: Union[List, Dict], *,
                  label: Optional[str] = None,
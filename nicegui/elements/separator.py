@@ -2,7 +2,6 @@ from ..element import Element
 
 
 class Separator(Element):
-
     def __init__(self) -> None:
         """Separator
 
@@ -5,7 +5,6 @@ from .mixins.value_element import ValueElement
 
 
 class Slider(ValueElement, DisableableElement):
-
     def __init__(self, *,
                  min: float,
                  max: float,
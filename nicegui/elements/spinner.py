@@ -33,7 +33,6 @@ SpinnerTypes = Literal[
 
 
 class Spinner(Element):
-
     def __init__(self,
                  type: Optional[SpinnerTypes] = 'default', *,
                  size: str = '1em',
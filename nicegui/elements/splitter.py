@@ -5,6 +5,7 @@ from .mixins.value_element import ValueElement
 
 
 class Splitter(ValueElement, DisableableElement):
+    __slots__ = ('before', 'after', 'separator')
 
     def __init__(self, *,
                  horizontal: Optional[bool] = False,
@@ -15,7 +16,7 @@ class Splitter(ValueElement, DisableableElement):
                  ) -> None:
         """Splitter
 
-        The `ui.splitter` element divides the screen space into resizable sections, 
+        The `ui.splitter` element divides the screen space into resizable sections,
         allowing for flexible and responsive layouts in your application.
 
         Based on Quasar's Splitter component:
@@ -0,0 +1,53 @@
+export default {
+  template: `
+    <q-table v-bind="$attrs" :rows="localRows">
+      <template v-for="(_, slot) in $slots" v-slot:[slot]="slotProps">
+        <slot :name="slot" v-bind="slotProps || {}" />
+      </template>
+    </q-table>
+  `,
+  props: {
+    rows: Array,
+  },
+  data() {
+    return {
+      localRows: [],
+    };
+  },
+  watch: {
+    rows: {
+      handler(newRows) {
+        this.localRows = [...newRows];
+        this.rowsByKey = new Map(this.localRows.map((row) => [this.key(row), row]));
+      },
+      immediate: true,
+    },
+  },
+  methods: {
+    key(row) {
+      return row[this.$attrs["row-key"]];
+    },
+    // NOTE: the row operations are idempotent, because the rows prop might already contain the changes
+    insert_rows(index, rows) {
+      const newRows = rows.filter((row) => {
+        if (!this.rowsByKey.has(this.key(row))) return true;
+        this.update_rows([row]);
+        return false;
+      });
+      if (index === null) index = this.localRows.length;
+      this.localRows.splice(index, 0, ...newRows);
+      // NOTE: the map holds the reactive rows, so that updating them re-renders the table
+      this.localRows.slice(index, index + newRows.length).forEach((row) => this.rowsByKey.set(this.key(row), row));
+    },
+    update_rows(rows) {
+      rows.forEach((row) => {
+        const existing = this.rowsByKey.get(this.key(row));
+        if (existing) Object.assign(existing, row);
+      });
+    },
+    remove_rows(keys) {
+      const removed = new Set(keys.filter((key) => this.rowsByKey.delete(key)));
+      if (removed.size) this.localRows = this.localRows.filter((row) => !removed.has(this.key(row)));
+    },
+  },
+};
@@ -1,13 +1,50 @@
-from typing import Any, Callable, Dict, List, Optional
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from typing_extensions import Literal
 
+from .. import background_tasks, globals, run_executor
+from ..dependencies import register_component
 from ..element import Element
 from ..events import TableSelectionEventArguments, handle_event
+from ..helpers import KWONLY_SLOTS, is_data_frame
 from .mixins.filter_element import FilterElement
 
+if TYPE_CHECKING:
+    import pandas
+
+register_component('table', __file__, 'table.js')
+
+
+@dataclass(**KWONLY_SLOTS)
+class TableRequest:
+    """Request for a page of rows which is passed to a function serving as table source."""
+    filter: Optional[str]
+    sort_by: Optional[str]
+    descending: bool
+    page: int
+    rows_per_page: int
+
+    @property
+    def start(self) -> int:
+        return (self.page - 1) * self.rows_per_page
+
+    @property
+    def stop(self) -> Optional[int]:
+        return self.start + self.rows_per_page if self.rows_per_page else None
+
+
+TableResult = Tuple[List[Dict], int]
+TableSource = Union[List[Dict], 'pandas.DataFrame',
+                    Callable[[TableRequest], Union[TableResult, Awaitable[TableResult]]]]
+
 
 class Table(FilterElement):
+    __slots__ = ('rows', 'row_key', 'selected', '_rows_by_key', '_source', '_ordered_source', '_source_version')
 
     def __init__(self,
                  columns: List[Dict],
@@ -31,12 +68,19 @@ class Table(FilterElement):
         :param on_select: callback which is invoked when the selection changes
 
         If selection is 'single' or 'multiple', then a `selection` property is accessible containing the selected rows.
+
+        Rows can be added, inserted, updated and removed by key without re-sending the whole table to the client.
+        After manipulating `rows` directly, call `update()` to send all rows to the client.
         """
-        super().__init__(tag='q-table')
+        super().__init__(tag='table')
 
         self.rows = rows
         self.row_key = row_key
         self.selected: List[Dict] = []
+        self._rows_by_key: Optional[Dict[Any, Dict]] = None  # NOTE: built when a keyed operation is used first
+        self._source: Optional[TableSource] = None
+        self._ordered_source: Optional[Tuple[Tuple, Any]] = None  # NOTE: filtered and sorted data of the last request
+        self._source_version = 0  # NOTE: incremented by `refresh` so that outdated orderings are not cached
 
         self._props['columns'] = columns
         self._props['rows'] = rows
@@ -54,21 +98,230 @@ class Table(FilterElement):
                 self.selected.extend(msg['args']['rows'])
             else:
                 self.selected[:] = [row for row in self.selected if row[row_key] not in msg['args']['keys']]
-            self.update()
+            self._props['selected'] = self.selected
+            self._update_fields()
             arguments = TableSelectionEventArguments(sender=self, client=self.client, selection=self.selected)
             handle_event(on_select, arguments)
         self.on('selection', handle_selection)
 
+    @staticmethod
+    def from_source(columns: List[Dict],
+                    source: TableSource, *,
+                    row_key: str = 'id',
+                    title: Optional[str] = None,
+                    selection: Optional[Literal['single', 'multiple']] = None,
+                    pagination: int = 10,
+                    on_select: Optional[Callable[..., Any]] = None,
+                    ) -> Table:
+        """Create a table which is paginated, sorted and filtered on the server.
+
+        Only the requested page is sent to the client.
+        The source can be a list of rows, a Pandas DataFrame or a function.
+        Lists and DataFrames are filtered by the values of all columns and sorted by the field of the sort column.
+        A function (which may be async) receives a `TableRequest` and returns the rows of the requested page
+        together with the total number of rows matching the filter.
+        Call `refresh()` after the data of the source has changed.
+
+        :param columns: list of column objects
+        :param source: list of rows, Pandas DataFrame or (async) function returning a page of rows and the row count
+        :param row_key: name of the column containing unique data identifying the row (default: "id")
+        :param title: title of the table
+        :param selection: selection type ("single" or "multiple"; default: `None`)
+        :param pagination: number of rows per page (0 means "infinite"; default: 10)
+        :param on_select: callback which is invoked when the selection changes
+        :return: Table
+        """
+        table = Table(columns, [], row_key=row_key, title=title, selection=selection,
+                      pagination=pagination, on_select=on_select)
+        table._source = source
+        table._props['pagination']['rowsNumber'] = 0  # NOTE: QTable emits request events if the row count is given
+        table.on('request', table._handle_request, ['pagination', 'filter'], coalesce=True)
+        table.refresh()
+        return table
+
+    def refresh(self) -> None:
+        """Reload the current page from the source of a server-side table, e.g. after the data has changed."""
+        if self._source is None:
+            return
+        self._ordered_source = None
+        self._source_version += 1
+        version = self._source_version
+        pagination = self._props['pagination']
+        result = self._request_rows(self._create_request(pagination, self.filter))
+        if not isawaitable(result):
+            self._set_page(pagination, *result)
+            return
+
+        async def set_page() -> None:
+            rows, rows_number = await result
+            if version != self._source_version:
+                return  # NOTE: a newer refresh is loading the page
+            if not self.client.shared and not self.client.has_socket_connection:
+                await self._wait_for_connection()  # NOTE: updates sent before the client has connected would be lost
+            self._set_page(pagination, rows, rows_number)
+        if globals.loop and globals.loop.is_running():
+            background_tasks.create(set_page(), name=f'refresh table {self.id}')
+        else:
+            globals.app.on_startup(set_page())
+
+    async def _wait_for_connection(self) -> None:
+        tasks = [asyncio.ensure_future(self.client._get_event(name).wait()) for name in ('connected', 'deleted')]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _handle_request(self, msg: Dict) -> None:
+        pagination = msg['args']['pagination']
+        version = self._source_version
+        result = self._request_rows(self._create_request(pagination, msg['args']['filter']))
+        if isawaitable(result):
+            self._props['loading'] = True
+            self._update_fields()
+            try:
+                result = await result
+            finally:
+                self._props['loading'] = False
+                self._update_fields()
+        if version != self._source_version:
+            return  # NOTE: the rows are outdated because `refresh` has reloaded the page in the meantime
+        self._set_page(pagination, *result)
+
+    @staticmethod
+    def _create_request(pagination: Dict, filter: Optional[str]) -> TableRequest:
+        return TableRequest(
+            filter=filter or None,
+            sort_by=pagination.get('sortBy') or None,
+            descending=bool(pagination.get('descending')),
+            page=pagination.get('page') or 1,
+            rows_per_page=pagination.get('rowsPerPage') or 0,
+        )
+
+    @staticmethod
+    def _get_cache_key(request: TableRequest) -> Tuple:
+        return (request.filter, request.sort_by, request.descending)
+
+    def _request_rows(self, request: TableRequest) -> Union[TableResult, Awaitable[TableResult]]:
+        if callable(self._source):
+            return self._source(request)
+        cache_key = self._get_cache_key(request)
+        if self._ordered_source is not None and self._ordered_source[0] == cache_key:
+            return self._slice(request, self._ordered_source[1])  # NOTE: changing the page is cheap
+        return self._request_ordered_rows(request, cache_key)
+
+    async def _request_ordered_rows(self, request: TableRequest, cache_key: Tuple) -> TableResult:
+        version = self._source_version
+        # NOTE: filtering and sorting large data should not block the event loop
+        data = await run_executor.io_bound(self._order_source, request)
+        if version == self._source_version:  # NOTE: `refresh` might have reset the cache in the meantime
+            self._ordered_source = (cache_key, data)
+        return self._slice(request, data)
+
+    @staticmethod
+    def _slice(request: TableRequest, data: Any) -> TableResult:
+        return (data.iloc[request.start:request.stop].to_dict('records') if is_data_frame(data) else
+                data[request.start:request.stop]), len(data)
+
+    def _order_source(self, request: TableRequest) -> Union[List[Dict], pandas.DataFrame]:
+        """Return the filtered and sorted data without modifying the table, so that it can run in a separate thread."""
+        fields = {column['name']: column.get('field', column['name']) for column in self._props['columns']}
+        if is_data_frame(self._source):
+            df = cast('pandas.DataFrame', self._source)
+            if request.filter:
+                columns = [field for field in fields.values() if field in df.columns]
+                mask = df[columns].astype(str).apply(
+                    lambda column: column.str.contains(request.filter, case=False, regex=False)).any(axis=1)
+                df = df[mask]
+            if request.sort_by in fields:
+                df = df.sort_values(fields[request.sort_by], ascending=not request.descending, kind='stable')
+            return df
+        rows = cast(List[Dict], self._source)
+        if request.filter:
+            needle = request.filter.lower()
+            rows = [row for row in rows if any(needle in str(row.get(field)).lower() for field in fields.values())]
+        if request.sort_by in fields:
+            field = fields[request.sort_by]
+            rows = sorted(rows, key=lambda row: (row.get(field) is None, row.get(field)), reverse=request.descending)
+        return rows
+
+    def _set_page(self, pagination: Dict, rows: List[Dict], rows_number: int) -> None:
+        self.rows = rows
+        self._rows_by_key = None
+        self._props['rows'] = rows
+        self._props['pagination'] = {**pagination, 'rowsNumber': rows_number}
+        self._update_fields()
+
+    def update(self) -> None:
+        self._props['rows'] = self.rows
+        self._rows_by_key = None
+        super().update()
+
+    def _get_rows_by_key(self) -> Dict[Any, Dict]:
+        """Return the index of rows by key, skipping rows without a key."""
+        if self._rows_by_key is None:
+            self._rows_by_key = {row[self.row_key]: row for row in self.rows if self.row_key in row}
+        return self._rows_by_key
+
+    def get_row(self, key: Any) -> Optional[Dict]:
+        """Get the row with the given key or `None` if there is no such row."""
+        return self._get_rows_by_key().get(key)
+
     def add_rows(self, *rows: Dict) -> None:
-        """Add rows to the table."""
-        self.rows.extend(rows)
-        self.update()
+        """Add rows to the end of the table."""
+        if not self._can_insert_by_key(rows):
+            # NOTE: rows without unique keys can not be added incrementally, so the whole table is sent instead
+            self.rows.extend(rows)
+            self.update()
+            return
+        self._insert_rows(None, rows)
+
+    def insert_rows(self, index: int, *rows: Dict) -> None:
+        """Insert rows with new unique keys before the given index."""
+        if not self._can_insert_by_key(rows):
+            raise ValueError(f'Inserted rows need new unique values for "{self.row_key}"')
+        self._insert_rows(index, rows)
+
+    def _can_insert_by_key(self, rows: Tuple[Dict, ...]) -> bool:
+        if any(self.row_key not in row for row in rows):
+            return False
+        keys = {row[self.row_key] for row in rows}
+        return len(keys) == len(rows) and keys.isdisjoint(self._get_rows_by_key())
+
+    def _insert_rows(self, index: Optional[int], rows: Tuple[Dict, ...]) -> None:
+        # NOTE: the rows list is the same object as the rows prop, so it stays up to date without being re-sent
+        if index is None:
+            self.rows.extend(rows)
+        else:
+            self.rows[index:index] = rows
+        self._get_rows_by_key().update((row[self.row_key], row) for row in rows)
+        self.run_method('insert_rows', index, rows)
+
+    def update_rows(self, *rows: Dict) -> None:
+        """Update existing rows which are identified by their key.
+
+        Only the given fields are changed, so a row can also be updated partially.
+        """
+        rows_by_key = self._get_rows_by_key()
+        missing = [row.get(self.row_key) for row in rows if row.get(self.row_key) not in rows_by_key]
+        if missing:
+            raise KeyError(f'There are no rows with keys {missing}')
+        for row in rows:
+            rows_by_key[row[self.row_key]].update(row)
+        self.run_method('update_rows', rows)
 
     def remove_rows(self, *rows: Dict) -> None:
         """Remove rows from the table."""
-        keys = [row[self.row_key] for row in rows]
-        self.rows[:] = [row for row in self.rows if row[self.row_key] not in keys]
-        self.update()
+        self.remove_rows_by_key(*(row[self.row_key] for row in rows))
+
+    def remove_rows_by_key(self, *keys: Any) -> None:
+        """Remove the rows with the given keys from the table."""
+        rows_by_key = self._get_rows_by_key()
+        removed = {key for key in keys if rows_by_key.pop(key, None) is not None}
+        if not removed:
+            return
+        self.rows[:] = [row for row in self.rows if self.row_key not in row or row[self.row_key] not in removed]
+        self.run_method('remove_rows', list(removed))
 
     class row(Element):
         def __init__(self) -> None:
@@ -6,6 +6,7 @@ from .mixins.value_element import ValueElement
 
 
 class Tabs(ValueElement):
+    __slots__ = ('panels',)
 
     def __init__(self, *,
                  value: Any = None,
@@ -24,6 +25,7 @@ class Tabs(ValueElement):
 
 
 class Tab(DisableableElement):
+    __slots__ = ('tabs',)
 
     def __init__(self, name: str, label: Optional[str] = None, icon: Optional[str] = None) -> None:
         """Tab
@@ -44,7 +46,6 @@ class Tab(DisableableElement):
 
 
 class TabPanels(ValueElement):
-
     def __init__(self,
                  tabs: Tabs, *,
                  value: Any = None,
@@ -67,7 +68,6 @@ class TabPanels(ValueElement):
 
 
 class TabPanel(DisableableElement):
-
     def __init__(self, name: str) -> None:
         """Tab Panel
 
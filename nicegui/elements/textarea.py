@@ -4,12 +4,12 @@ from .input import Input
 
 
 class Textarea(Input):
-
     def __init__(self,
                  label: Optional[str] = None, *,
                  placeholder: Optional[str] = None,
                  value: str = '',
                  on_change: Optional[Callable[..., Any]] = None,
+                 cancel_previous: bool = False,
                  validation: Dict[str, Callable[..., bool]] = {},
                  ) -> None:
         """Textarea
@@ -21,7 +21,9 @@ class Textarea(Input):
         :param placeholder: text to show if no value is entered
         :param value: the initial value of the field
         :param on_change: callback to execute when the value changes
+        :param cancel_previous: whether to cancel a still running async `on_change` callback when the user changes the value again (default: `False`)
         :param validation: dictionary of validation rules, e.g. ``{'Too short!': lambda value: len(value) < 3}``
         """
-        super().__init__(label, placeholder=placeholder, value=value, on_change=on_change, validation=validation)
+        super().__init__(label, placeholder=placeholder, value=value, on_change=on_change,
+                         cancel_previous=cancel_previous, validation=validation)
         self._props['type'] = 'textarea'
@@ -5,7 +5,6 @@ from .mixins.value_element import ValueElement
 
 
 class Time(ValueElement, DisableableElement):
-
     def __init__(self,
                  value: Optional[str] = None, *,
                  mask: str = 'HH:mm',
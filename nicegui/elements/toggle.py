@@ -5,7 +5,6 @@ from .mixins.disableable_element import DisableableElement
 
 
 class Toggle(ChoiceElement, DisableableElement):
-
     def __init__(self,
                  options: Union[List, Dict], *,
                  value: Any = None,
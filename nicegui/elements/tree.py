@@ -6,7 +6,6 @@ from ..element import Element
 
 
 class Tree(Element):
-
     def __init__(self, nodes: List, *,
                  node_key: str = 'id',
                  label_key: str = 'label',
@@ -41,7 +40,7 @@ class Tree(Element):
         def update_prop(name: str, value: Any) -> None:
             if self._props[name] != value:
                 self._props[name] = value
-                self.update()
+                self._update_fields()
 
         def handle_selected(msg: Dict) -> None:
             update_prop('selected', msg['args'])
@@ -12,7 +12,6 @@ register_component('upload', __file__, 'upload.js')
 
 
 class Upload(DisableableElement):
-
     def __init__(self, *,
                  multiple: bool = False,
                  max_file_size: Optional[int] = None,
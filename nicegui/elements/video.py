@@ -7,7 +7,6 @@ register_component('video', __file__, 'video.js')
 
 
 class Video(Element):
-
     def __init__(self, src: str, *,
                  controls: bool = True,
                  autoplay: bool = False,
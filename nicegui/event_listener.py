@@ -2,7 +2,7 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
-from .helpers import KWONLY_SLOTS
+from .helpers import KWONLY_SLOTS, expects_arguments
 
 
 @dataclass(**KWONLY_SLOTS)
@@ -15,17 +15,20 @@ class EventListener:
     throttle: float
     leading_events: bool
     trailing_events: bool
+    coalesce: bool
+    cancel_previous: bool
+    handler_expects_arguments: bool = field(init=False, repr=False)
+    _dict: Dict[str, Any] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.id = str(uuid.uuid4())
-
-    def to_dict(self) -> Dict[str, Any]:
+        self.handler_expects_arguments = expects_arguments(self.handler)
         words = self.type.split('.')
         type = words.pop(0)
         specials = [w for w in words if w in {'capture', 'once', 'passive'}]
         modifiers = [w for w in words if w in {'stop', 'prevent', 'self', 'ctrl', 'shift', 'alt', 'meta'}]
         keys = [w for w in words if w not in specials + modifiers]
-        return {
+        self._dict = {
             'listener_id': self.id,
             'type': type,
             'specials': specials,
@@ -36,3 +39,6 @@ class EventListener:
             'leading_events': self.leading_events,
             'trailing_events': self.trailing_events,
         }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._dict
@@ -1,14 +1,20 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from inspect import Parameter, signature
-from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Union
 
 from . import background_tasks, globals
-from .helpers import KWONLY_SLOTS, is_coroutine
+from .helpers import KWONLY_SLOTS, expects_arguments, is_coroutine
 
 if TYPE_CHECKING:
     from .client import Client
     from .element import Element
 
+handler_tasks: 'ContextVar[Optional[List[asyncio.Task]]]' = ContextVar('handler_tasks', default=None)
+running_handler_tasks: Dict[str, Set[asyncio.Task]] = {}
+
 
 @dataclass(**KWONLY_SLOTS)
 class EventArguments:
@@ -270,22 +276,56 @@ class KeyEventArguments(EventArguments):
 
 def handle_event(handler: Optional[Callable[..., Any]],
                  arguments: Union[EventArguments, Dict], *,
-                 sender: Optional['Element'] = None) -> None:
+                 sender: Optional['Element'] = None,
+                 handler_expects_arguments: Optional[bool] = None) -> None:
     try:
         if handler is None:
             return
-        no_arguments = not any(p.default is Parameter.empty for p in signature(handler).parameters.values())
+        if handler_expects_arguments is None:
+            handler_expects_arguments = expects_arguments(handler)
         sender = arguments.sender if isinstance(arguments, EventArguments) else sender
         assert sender is not None and sender.parent_slot is not None
         with sender.parent_slot:
-            result = handler() if no_arguments else handler(arguments)
+            result = handler(arguments) if handler_expects_arguments else handler()
         if is_coroutine(handler):
             async def wait_for_result():
                 with sender.parent_slot:
                     await result
             if globals.loop and globals.loop.is_running():
-                background_tasks.create(wait_for_result(), name=str(handler))
+                task = background_tasks.create(wait_for_result(), name=str(handler))
+                tasks = handler_tasks.get()
+                if tasks is not None:
+                    tasks.append(task)
             else:
                 globals.app.on_startup(wait_for_result())
     except Exception as e:
         globals.handle_exception(e)
+
+
+@contextmanager
+def collect_handler_tasks() -> Iterator[List[asyncio.Task]]:
+    """Collect the tasks of all async handlers which are invoked within this context."""
+    tasks: List[asyncio.Task] = []
+    token = handler_tasks.set(tasks)
+    try:
+        yield tasks
+    finally:
+        handler_tasks.reset(token)
+
+
+def replace_handler_tasks(key: str, tasks: List[asyncio.Task]) -> None:
+    """Cancel the handler tasks which are still running for the given key and keep track of the new ones instead."""
+    for task in running_handler_tasks.pop(key, set()):
+        task.cancel()
+    if tasks:
+        running_handler_tasks[key] = set(tasks)
+        for task in tasks:
+            task.add_done_callback(partial(_forget_handler_task, key))
+
+
+def _forget_handler_task(key: str, task: asyncio.Task) -> None:
+    tasks = running_handler_tasks.get(key)
+    if tasks is not None:
+        tasks.discard(task)
+        if not tasks:
+            del running_handler_tasks[key]
@@ -15,7 +15,7 @@ async def run_javascript(code: str, *,
     :param code: JavaScript code to run
     :param respond: whether to wait for a response (default: `True`)
     :param timeout: timeout in seconds (default: `1.0`)
-    :param check_interval: interval in seconds to check for a response (default: `0.01`)
+    :param check_interval: not used anymore, the response is awaited directly
 
     :return: response from the browser, or `None` if `respond` is `False`
     """
@@ -1,8 +1,10 @@
-import asyncio
+import math
 import time
 from typing import Any, Callable, Optional
 
-from .. import background_tasks, globals
+from typing_extensions import Literal
+
+from .. import background_tasks, globals, scheduler
 from ..binding import BindableProperty
 from ..helpers import is_coroutine
 from ..slot import Slot
@@ -17,6 +19,8 @@ class Timer:
                  callback: Callable[..., Any], *,
                  active: bool = True,
                  once: bool = False,
+                 missed_ticks: Literal['skip', 'catch_up'] = 'skip',
+                 pause_when_hidden: bool = False,
                  ) -> None:
         """Timer
 
@@ -24,86 +28,84 @@ class Timer:
         for example to show a graph with incoming measurements.
         A timer will execute a callback repeatedly with a given interval.
 
+        All timers are run by a central scheduler.
+        Ticks are scheduled relative to the previous due time, so slow callbacks do not cause the timer to drift.
+
         :param interval: the interval in which the timer is called (can be changed during runtime)
         :param callback: function or coroutine to execute when interval elapses
         :param active: whether the callback should be executed or not (can be changed during runtime)
         :param once: whether the callback is only executed once after a delay specified by `interval` (default: `False`)
+        :param missed_ticks: what to do with ticks which were missed because the server or the callback was too slow: skip them (`'skip'`, default) or run them as soon as possible (`'catch_up'`)
+        :param pause_when_hidden: whether to pause the timer while the page is hidden in the browser, e.g. in a background tab (default: `False`, has no effect on the auto-index page)
         """
         self.interval = interval
         self.callback: Optional[Callable[..., Any]] = callback
         self.active = active
+        self.once = once
+        self.missed_ticks = missed_ticks
+        self.pause_when_hidden = pause_when_hidden
         self.slot: Optional[Slot] = globals.get_slot()
+        self.client = self.slot.parent.client
+        self._due: Optional[float] = None
 
-        coroutine = self._run_once if once else self._run_in_loop
         if globals.state == globals.State.STARTED:
-            background_tasks.create(coroutine(), name=str(callback))
+            self._start()
         else:
-            globals.app.on_startup(coroutine)
+            globals.app.on_startup(self._start)
 
-    async def _run_once(self) -> None:
-        try:
-            if not await self._connected():
-                return
-            assert self.slot is not None
-            with self.slot:
-                await asyncio.sleep(self.interval)
-                if globals.state not in {globals.State.STOPPING, globals.State.STOPPED}:
-                    await self._invoke_callback()
-        finally:
-            self.cleanup()
+    def _start(self) -> None:
+        scheduler.schedule_when_connected(self, self.interval if self.once else 0.0)
 
-    async def _run_in_loop(self) -> None:
+    def _tick(self, due: float) -> None:
+        """Execute the callback and schedule the next tick (called by the scheduler)."""
+        if self.client.id not in globals.clients or globals.state in {globals.State.STOPPING, globals.State.STOPPED}:
+            self.cancel()
+            return
+        if self.pause_when_hidden and self.client.is_hidden:
+            scheduler.suspend(self, due)
+            return
+        if not self.active:
+            self._schedule_next(due)
+            return
+        slot, callback = self.slot, self.callback
+        assert slot is not None and callback is not None
+        waiting = False
         try:
-            if not await self._connected():
-                return
-            assert self.slot is not None
-            with self.slot:
-                while True:
-                    if self.slot.parent.client.id not in globals.clients:
-                        break
-                    if globals.state in {globals.State.STOPPING, globals.State.STOPPED}:
-                        break
+            with slot:
+                result = callback()
+            if is_coroutine(callback):
+                async def wait_for_result() -> None:
                     try:
-                        start = time.time()
-                        if self.active:
-                            await self._invoke_callback()
-                        dt = time.time() - start
-                        await asyncio.sleep(self.interval - dt)
-                    except asyncio.CancelledError:
-                        break
+                        with slot:
+                            await result
                     except Exception as e:
                         globals.handle_exception(e)
-                        await asyncio.sleep(self.interval)
-        finally:
-            self.cleanup()
-
-    async def _invoke_callback(self) -> None:
-        try:
-            assert self.callback is not None
-            result = self.callback()
-            if is_coroutine(self.callback):
-                await result
+                    if self.callback is not None:  # NOTE: the timer might have been cancelled in the meantime
+                        self._schedule_next(due)  # NOTE: the next tick is not scheduled before the coroutine is done
+                background_tasks.create(wait_for_result(), name=str(callback))
+                waiting = True
         except Exception as e:
             globals.handle_exception(e)
+        finally:
+            if not waiting:
+                self._schedule_next(due)
 
-    async def _connected(self, timeout: float = 60.0) -> bool:
-        """Wait for the client connection before the timer callback can be allowed to manipulate the state.
+    def _schedule_next(self, due: float) -> None:
+        if self.once or self.callback is None:
+            self.cancel()
+            return
+        next_due = due + self.interval
+        now = time.monotonic()
+        if next_due < now and self.missed_ticks == 'skip':
+            next_due += math.ceil((now - next_due) / self.interval) * self.interval if self.interval > 0 else now - next_due
+        scheduler.schedule(self, next_due)
 
-        See https://github.com/zauberzeug/nicegui/issues/206 for details.
-        Returns True if the client is connected, False if the client is not connected and the timer should be cancelled.
-        """
-        assert self.slot is not None
-        if self.slot.parent.client.shared:
-            return True
-        else:
-            # ignore served pages which do not reconnect to backend (eg. monitoring requests, scrapers etc.)
-            try:
-                await self.slot.parent.client.connected(timeout=timeout)
-                return True
-            except TimeoutError:
-                globals.log.error(f'Timer cancelled because client is not connected after {timeout} seconds')
-                return False
+    def cancel(self) -> None:
+        """Stop the timer."""
+        scheduler.unschedule(self)
+        self.cleanup()
 
     def cleanup(self) -> None:
         self.slot = None
         self.callback = None
+        self._due = None
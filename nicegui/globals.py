@@ -1,14 +1,15 @@
 import asyncio
-import inspect
 import logging
 from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from socketio import AsyncServer
+from typing_extensions import Literal
 from uvicorn import Server
 
-from . import background_tasks
+from . import background_tasks, helpers
 from .app import App
 from .language import Language
 
@@ -39,12 +40,16 @@ favicon: Optional[str]
 dark: Optional[bool]
 language: Language
 binding_refresh_interval: float
+min_update_interval: float = 0.0
+send_buffer_size: int = 10
+send_buffer_overflow: Literal['coalesce', 'drop', 'disconnect'] = 'coalesce'
+transport_encoding: Literal['json', 'msgpack'] = 'json'
 excludes: List[str]
 tailwind: bool
 socket_io_js_extra_headers: Dict = {}
 
 _socket_id: Optional[str] = None
-slot_stacks: Dict[int, List['Slot']] = {}
+slot_stack: 'ContextVar[Tuple[Slot, ...]]' = ContextVar('slot_stack', default=())
 clients: Dict[str, 'Client'] = {}
 index_client: 'Client'
 
@@ -57,24 +62,17 @@ disconnect_handlers: List[Union[Callable[..., Any], Awaitable]] = []
 exception_handlers: List[Callable[..., Any]] = [log.exception]
 
 
-def get_task_id() -> int:
-    try:
-        return id(asyncio.current_task())
-    except RuntimeError:
-        return 0
+def get_slot_stack() -> Tuple['Slot', ...]:
+    """Return the slot stack of the current context (tasks and threads started with a copy of the context inherit it)."""
+    return slot_stack.get()
 
 
-def get_slot_stack() -> List['Slot']:
-    task_id = get_task_id()
-    if task_id not in slot_stacks:
-        slot_stacks[task_id] = []
-    return slot_stacks[task_id]
+def push_slot(slot: 'Slot') -> None:
+    slot_stack.set(slot_stack.get() + (slot,))
 
 
-def prune_slot_stack() -> None:
-    task_id = get_task_id()
-    if not slot_stacks[task_id]:
-        del slot_stacks[task_id]
+def pop_slot() -> None:
+    slot_stack.set(slot_stack.get()[:-1])
 
 
 def get_slot() -> 'Slot':
@@ -95,6 +93,6 @@ def socket_id(id: str) -> Iterator[None]:
 
 def handle_exception(exception: Exception) -> None:
     for handler in exception_handlers:
-        result = handler() if not inspect.signature(handler).parameters else handler(exception)
+        result = handler() if not helpers.get_signature(handler).parameters else handler(exception)
         if isinstance(result, Awaitable):
             background_tasks.create(result)
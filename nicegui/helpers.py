@@ -5,6 +5,7 @@ import socket
 import sys
 import threading
 import time
+import weakref
 import webbrowser
 from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, Tuple, Union
@@ -17,12 +18,45 @@ if TYPE_CHECKING:
 KWONLY_SLOTS = {'kw_only': True, 'slots': True} if sys.version_info >= (3, 10) else {}
 
 
+signatures: 'weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature]' = weakref.WeakKeyDictionary()
+method_signatures: 'weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature]' = weakref.WeakKeyDictionary()
+
+
+def get_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Return the signature of a callable.
+
+    The signature is cached as long as the callable exists, so frequently called handlers are inspected only once.
+    Bound methods are created anew on each attribute access, so their signature is cached for the underlying function.
+    """
+    function = getattr(func, '__func__', func)
+    cache = signatures if function is func else method_signatures  # NOTE: bound methods have no "self" parameter
+    try:
+        return cache[function]
+    except KeyError:
+        pass
+    except TypeError:
+        return inspect.signature(func)  # NOTE: the callable can not be weakly referenced
+    signature = inspect.signature(func)
+    cache[function] = signature
+    return signature
+
+
+def expects_arguments(func: Callable[..., Any]) -> bool:
+    """Return whether the callable has parameters without default values."""
+    return any(p.default is inspect.Parameter.empty for p in get_signature(func).parameters.values())
+
+
 def is_coroutine(object: Any) -> bool:
     while isinstance(object, functools.partial):
         object = object.func
     return asyncio.iscoroutinefunction(object)
 
 
+def is_data_frame(object: Any) -> bool:
+    pandas = sys.modules.get('pandas')  # NOTE: pandas is optional, but if it has not been imported, there is no DataFrame
+    return pandas is not None and isinstance(object, pandas.DataFrame)
+
+
 def safe_invoke(func: Union[Callable[..., Any], Awaitable], client: Optional['Client'] = None) -> None:
     try:
         if isinstance(func, Awaitable):
@@ -32,7 +66,7 @@ def safe_invoke(func: Union[Callable[..., Any], Awaitable], client: Optional['Cl
             background_tasks.create(func_with_client())
         else:
             with client or nullcontext():
-                result = func(client) if len(inspect.signature(func).parameters) == 1 and client is not None else func()
+                result = func(client) if len(get_signature(func).parameters) == 1 and client is not None else func()
             if isinstance(result, Awaitable):
                 async def result_with_client():
                     with client or nullcontext():
@@ -0,0 +1,46 @@
+"""
+Socket.IO packet class which serializes messages with MessagePack instead of JSON.
+
+It is used when running NiceGUI with `ui.run(transport_encoding='msgpack')`
+and extends python-socketio's implementation with support for numpy arrays and
+the other types which are also supported by NiceGUI's custom json module.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import msgpack
+import numpy as np
+from socketio.msgpack_packet import MsgPackPacket as SocketIOMsgPackPacket
+
+
+class MsgPackPacket(SocketIOMsgPackPacket):
+
+    def encode(self) -> bytes:
+        """Encode the packet for transmission."""
+        return dumps(self._to_dict())
+
+    def decode(self, encoded_packet: bytes) -> None:
+        """Decode a transmitted packet."""
+        decoded = msgpack.unpackb(encoded_packet, strict_map_key=False)  # NOTE: element dictionaries use integer keys
+        self.packet_type = decoded['type']
+        self.data = decoded.get('data')
+        self.id = decoded.get('id')
+        self.namespace = decoded['nsp']
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializes a Python object to MessagePack, including numpy arrays and date/datetime objects."""
+    return msgpack.packb(obj, default=_msgpack_converter)
+
+
+def _msgpack_converter(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not MessagePack serializable')
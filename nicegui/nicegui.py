@@ -15,7 +15,7 @@ from fastapi_socketio import SocketManager
 from nicegui import json
 from nicegui.json import NiceGUIJSONResponse
 
-from . import __version__, background_tasks, binding, favicon, globals, outbox
+from . import __version__, background_tasks, binding, dependencies, favicon, globals, outbox, run_executor, scheduler
 from .app import App
 from .client import Client
 from .dependencies import js_components, js_dependencies
@@ -28,6 +28,7 @@ globals.app = app = App(default_response_class=NiceGUIJSONResponse)
 # NOTE we use custom json module which wraps orjson
 socket_manager = SocketManager(app=app, mount_location='/_nicegui_ws/', json=json)
 globals.sio = sio = socket_manager._sio
+json_packet_class = sio.packet_class
 
 app.add_middleware(GZipMiddleware)
 static_files = StaticFiles(
@@ -51,6 +52,13 @@ def get_dependencies(id: int, name: str):
     raise HTTPException(status_code=404, detail=f'dependency "{name}" with ID {id} not found')
 
 
+@app.get(f'/_nicegui/{__version__}/components.js')
+def get_components_module(v: str = ''):
+    module = dependencies.get_components_module()
+    headers = {'Cache-Control': 'public, max-age=31536000, immutable'} if v == module.hash else {'Cache-Control': 'no-cache'}
+    return Response(module.code, media_type='text/javascript', headers=headers)
+
+
 @app.get(f'/_nicegui/{__version__}' + '/components/{name}')
 def get_components(name: str):
     return FileResponse(js_components[name].path, media_type='text/javascript')
@@ -73,6 +81,12 @@ def handle_startup(with_welcome_message: bool = True) -> None:
             globals.app.add_route('/favicon.ico', lambda _: favicon.get_favicon_response())
     else:
         globals.app.add_route('/favicon.ico', lambda _: FileResponse(Path(__file__).parent / 'static' / 'favicon.ico'))
+    if globals.transport_encoding == 'msgpack':
+        from .msgpack_packet import MsgPackPacket
+        sio.packet_class = MsgPackPacket
+    else:
+        sio.packet_class = json_packet_class
+    dependencies.get_components_module()  # NOTE: compile the components once before the first page is requested
     globals.state = globals.State.STARTING
     globals.loop = asyncio.get_running_loop()
     with globals.index_client:
@@ -80,8 +94,8 @@ def handle_startup(with_welcome_message: bool = True) -> None:
             safe_invoke(t)
     background_tasks.create(binding.loop())
     background_tasks.create(outbox.loop())
+    background_tasks.create(scheduler.loop())
     background_tasks.create(prune_clients())
-    background_tasks.create(prune_slot_stacks())
     globals.state = globals.State.STARTED
     if with_welcome_message:
         print_welcome_message()
@@ -111,6 +125,7 @@ async def handle_shutdown() -> None:
     with globals.index_client:
         for t in globals.shutdown_handlers:
             safe_invoke(t)
+    run_executor.tear_down()
     globals.state = globals.State.STOPPED
 
 
@@ -135,7 +150,7 @@ def handle_handshake(sid: str) -> bool:
     client = get_client(sid)
     if not client:
         return False
-    client.environ = sio.get_environ(sid)
+    client.handle_handshake(sio.get_environ(sid))
     sio.enter_room(sid, client.id)
     for t in client.connect_handlers:
         safe_invoke(t, client)
@@ -168,12 +183,25 @@ def handle_event(sid: str, msg: Dict) -> None:
             sender._handle_event(msg)
 
 
+@sio.on('visibility')
+def handle_visibility(sid: str, msg: Dict) -> None:
+    client = get_client(sid)
+    if not client or client.shared:  # NOTE: a shared client might still be visible in other tabs
+        return
+    client.is_hidden = not msg['visible']
+    if not client.is_hidden:
+        outbox.resume_client(client.id)
+        scheduler.resume_client(client.id)
+
+
 @sio.on('javascript_response')
 def handle_javascript_response(sid: str, msg: Dict) -> None:
     client = get_client(sid)
     if not client:
         return
-    client.waiting_javascript_commands[msg['request_id']] = msg['result']
+    response = client.waiting_javascript_commands.get(msg['request_id'])
+    if response is not None and not response.done():
+        response.set_result(msg['result'])
 
 
 def get_client(sid: str) -> Optional[Client]:
@@ -195,25 +223,11 @@ async def prune_clients() -> None:
         await asyncio.sleep(10)
 
 
-async def prune_slot_stacks() -> None:
-    while True:
-        running = [
-            id(task)
-            for task in asyncio.tasks.all_tasks()
-            if not task.done() and not task.cancelled()
-        ]
-        stale = [
-            id_
-            for id_ in globals.slot_stacks
-            if id_ not in running
-        ]
-        for id_ in stale:
-            del globals.slot_stacks[id_]
-        await asyncio.sleep(10)
-
-
 def delete_client(id: str) -> None:
+    scheduler.remove_client(id)
     binding.remove(list(globals.clients[id].elements.values()), Element)
     for element in globals.clients[id].elements.values():
         element.delete()
+    outbox.remove_client(id)
+    globals.clients[id].handle_deletion()
     del globals.clients[id]
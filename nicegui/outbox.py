@@ -1,8 +1,8 @@
 import asyncio
 from collections import defaultdict, deque
-from typing import TYPE_CHECKING, Any, DefaultDict, Deque, Dict, Tuple
+from typing import TYPE_CHECKING, Any, Callable, DefaultDict, Deque, Dict, Iterable, List, Optional, Tuple
 
-from . import globals
+from . import background_tasks, globals
 
 if TYPE_CHECKING:
     from .element import Element
@@ -11,38 +11,273 @@ ClientId = str
 ElementId = int
 MessageType = str
 Message = Tuple[ClientId, MessageType, Any]
+Batch = List[Tuple[MessageType, Any]]
+
+TRANSPORT_TIMEOUT = 1.0
 
 update_queue: DefaultDict[ClientId, Dict[ElementId, 'Element']] = defaultdict(dict)
+patch_queue: DefaultDict[ClientId, Dict[ElementId, 'Element']] = defaultdict(dict)
 message_queue: Deque[Message] = deque()
+flush_callbacks: List[Callable[[], None]] = []
+enqueue_event: Optional[asyncio.Event] = None
+
+send_queues: DefaultDict[ClientId, Deque[Batch]] = defaultdict(deque)
+send_tasks: Dict[ClientId, asyncio.Task] = {}
+
+# NOTE: updates for hidden clients are parked until the page becomes visible again
+parked_updates: DefaultDict[ClientId, Dict[ElementId, 'Element']] = defaultdict(dict)
+parked_patches: DefaultDict[ClientId, Dict[ElementId, 'Element']] = defaultdict(dict)
+parked_messages: DefaultDict[ClientId, Batch] = defaultdict(list)
 
 
 def enqueue_update(element: 'Element') -> None:
     update_queue[element.client.id][element.id] = element
+    _notify()
+
+
+def enqueue_patch(element: 'Element') -> None:
+    patch_queue[element.client.id][element.id] = element
+    _notify()
 
 
 def enqueue_message(message_type: 'MessageType', data: Any, client_id: 'ClientId') -> None:
     message_queue.append((client_id, message_type, data))
+    _notify()
+
+
+def enqueue_flush_callback(callback: Callable[[], None]) -> None:
+    """Call a function once at the beginning of the next flush, e.g. to enqueue messages collected in the meantime."""
+    flush_callbacks.append(callback)
+    _notify()
+
+
+def _notify() -> None:
+    """Wake up the outbox loop; this is safe to call from threads other than the event loop."""
+    if enqueue_event is None or enqueue_event.is_set() or globals.loop is None:
+        return
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is globals.loop:
+        enqueue_event.set()
+    else:
+        globals.loop.call_soon_threadsafe(enqueue_event.set)
+
+
+def queue_depth(client_id: ClientId) -> int:
+    """Return the number of batches which are waiting to be sent to the given client."""
+    return len(send_queues.get(client_id, ()))
+
+
+def resume_client(client_id: ClientId) -> None:
+    """Send everything which has been parked while the client was hidden as a single coalesced update."""
+    if client_id in parked_updates:
+        update_queue[client_id].update(parked_updates.pop(client_id))
+    if client_id in parked_patches:
+        patch_queue[client_id].update(parked_patches.pop(client_id))
+    messages = parked_messages.pop(client_id, [])
+    message_queue.extendleft((client_id, message_type, data) for message_type, data in reversed(messages))
+    _notify()
+
+
+def remove_client(client_id: ClientId) -> None:
+    """Discard all pending batches of a client and stop sending to it."""
+    parked_updates.pop(client_id, None)
+    parked_patches.pop(client_id, None)
+    parked_messages.pop(client_id, None)
+    send_queues.pop(client_id, None)
+    task = send_tasks.pop(client_id, None)
+    if task:
+        task.cancel()
+
+
+def _is_hidden(client_id: ClientId) -> bool:
+    client = globals.clients.get(client_id)
+    return client is not None and client.is_hidden
+
+
+def _park_hidden_clients() -> None:
+    """Move queued updates, patches and messages of hidden clients aside without serializing them."""
+    for client_id in [client_id for client_id in update_queue if _is_hidden(client_id)]:
+        parked_updates[client_id].update(update_queue.pop(client_id))
+        for element_id in parked_updates[client_id]:
+            parked_patches.get(client_id, {}).pop(element_id, None)
+    for client_id in [client_id for client_id in patch_queue if _is_hidden(client_id)]:
+        parked = parked_updates.get(client_id, {})
+        parked_patches[client_id].update((element_id, element)
+                                         for element_id, element in patch_queue.pop(client_id).items()
+                                         if element_id not in parked)
+    if any(_is_hidden(client_id) for client_id, _, _ in message_queue):
+        remaining = [message for message in message_queue if not _park_message(*message)]
+        message_queue.clear()
+        message_queue.extend(remaining)
+
+
+def _park_message(client_id: ClientId, message_type: MessageType, data: Any) -> bool:
+    if not _is_hidden(client_id):
+        return False
+    if message_type == 'run_javascript' and data['request_id'] is not None:
+        return False  # NOTE: someone is waiting for the response
+    parked_messages[client_id].append((message_type, data))
+    return True
+
+
+def _send(client_id: ClientId, batch: Batch) -> None:
+    queue = send_queues[client_id]
+    queue.append(batch)
+    if len(queue) > globals.send_buffer_size:
+        if globals.send_buffer_overflow == 'disconnect':
+            globals.log.warning(f'Disconnecting client {client_id} because its send buffer is full')
+            remove_client(client_id)
+            for sid, _ in _get_participants(client_id):
+                background_tasks.create(globals.sio.disconnect(sid), name='disconnect slow client')
+            return
+        merged = _coalesce(queue, drop_run_method=globals.send_buffer_overflow == 'drop')
+        queue.clear()
+        queue.append(merged)
+    if client_id not in send_tasks:
+        send_tasks[client_id] = background_tasks.create(_drain(client_id), name=f'send to {client_id}')
+
+
+def _coalesce(batches: Iterable[Batch], *, drop_run_method: bool = False) -> Batch:
+    """Merge multiple batches into one, keeping only the latest state of each element.
+
+    The merged updates and patches take the place of the first update or patch, so the order of the other messages
+    is kept and messages which followed an update (e.g. method calls of a new element) still find their element.
+    """
+    updates: Dict[ElementId, Dict[str, Any]] = {}
+    patches: Dict[ElementId, Dict[str, Any]] = {}
+    messages: Batch = []
+    position: Optional[int] = None
+    for batch in batches:
+        for message_type, data in batch:
+            if message_type in {'update', 'patch'} and position is None:
+                position = len(messages)
+            if message_type == 'update':
+                for element_id, element_dict in data.items():
+                    updates[element_id] = element_dict
+                    patches.pop(element_id, None)
+            elif message_type == 'patch':
+                for element_id, patch in data.items():
+                    if element_id in updates:
+                        updates[element_id] = _merge_patch(updates[element_id], patch)
+                    elif element_id in patches:
+                        patches[element_id] = _merge_patch(patches[element_id], patch)
+                    else:
+                        patches[element_id] = patch
+            elif message_type == 'run_method' and drop_run_method:
+                continue
+            else:
+                messages.append((message_type, data))
+    merged: Batch = []
+    if updates:
+        merged.append(('update', updates))
+    if patches:
+        merged.append(('patch', patches))
+    if position is None:
+        return messages
+    return messages[:position] + merged + messages[position:]
+
+
+def _merge_patch(target: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a patch into an element dictionary or into an earlier patch of the same element."""
+    result = {key: value for key, value in target.items() if key not in {'props', 'removed_props'}}
+    result.update({key: value for key, value in patch.items() if key not in {'props', 'removed_props'}})
+    props = {**target.get('props', {}), **patch.get('props', {})}
+    removed = set(target.get('removed_props', [])).difference(patch.get('props', {}))
+    for key in patch.get('removed_props', []):
+        props.pop(key, None)
+        removed.add(key)
+    if props or 'props' in target:
+        result['props'] = props
+    if removed and 'tag' not in target:  # NOTE: complete element dictionaries do not need to list removed props
+        result['removed_props'] = list(removed)
+    return result
+
+
+async def _drain(client_id: ClientId) -> None:
+    try:
+        queue = send_queues[client_id]
+        while queue:
+            batch = queue.popleft()
+            try:
+                await globals.sio.emit('batch', batch, room=client_id)
+                await _wait_for_transport(client_id)
+            except Exception as e:
+                globals.handle_exception(e)
+    finally:
+        if send_tasks.get(client_id) is asyncio.current_task():
+            del send_tasks[client_id]
+        if not send_queues.get(client_id):
+            send_queues.pop(client_id, None)
+
+
+def _get_participants(client_id: ClientId) -> List[Tuple[str, str]]:
+    if '/' not in globals.sio.manager.rooms:
+        return []  # NOTE: there are no rooms before the first socket connected
+    return list(globals.sio.manager.get_participants('/', client_id))
+
+
+async def _wait_for_transport(client_id: ClientId) -> None:
+    """Wait until the transports of all sockets in the room have picked up the previously emitted packets.
+
+    This way a slow connection only delays its own batches, which are buffered (and possibly coalesced) by the outbox.
+    """
+    # NOTE: the engine.io socket queue is unbounded, so we use it to detect whether the client is falling behind;
+    # this relies on the internals of python-engineio 4 (see pyproject.toml), otherwise batches are sent without waiting
+    sockets = getattr(getattr(globals.sio, 'eio', None), 'sockets', None)
+    if not isinstance(sockets, dict):
+        return
+    queues = []
+    for _, eio_sid in _get_participants(client_id):
+        queue = getattr(sockets.get(eio_sid), 'queue', None)
+        if isinstance(queue, asyncio.Queue) and not queue.empty():
+            queues.append(queue)
+    if not queues:
+        return
+    tasks = [asyncio.ensure_future(queue.join()) for queue in queues]
+    _, pending = await asyncio.wait(tasks, timeout=TRANSPORT_TIMEOUT)
+    for task in pending:
+        task.cancel()
 
 
 async def loop() -> None:
+    global enqueue_event
+    enqueue_event = asyncio.Event()
     while True:
-        if not update_queue and not message_queue:
-            await asyncio.sleep(0.01)
-            continue
-        coros = []
+        if not update_queue and not patch_queue and not message_queue and not flush_callbacks:
+            await enqueue_event.wait()
+        enqueue_event.clear()
         try:
+            callbacks = flush_callbacks[:]
+            flush_callbacks.clear()
+            for callback in callbacks:
+                callback()
+            _park_hidden_clients()
+            batches: DefaultDict[ClientId, Batch] = defaultdict(list)
             for client_id, elements in update_queue.items():
                 data = {element_id: element._to_dict() for element_id, element in elements.items()}
-                coros.append(globals.sio.emit('update', data, room=client_id))
+                for element in elements.values():
+                    element._reset_changes()
+                batches[client_id].append(('update', data))
+            for client_id, elements in patch_queue.items():
+                updated = update_queue.get(client_id, {})
+                data = {
+                    element_id: element._to_patch()
+                    for element_id, element in elements.items()
+                    if element_id not in updated
+                }
+                if data:
+                    batches[client_id].append(('patch', data))
             update_queue.clear()
+            patch_queue.clear()
             for client_id, message_type, data in message_queue:
-                coros.append(globals.sio.emit(message_type, data, room=client_id))
+                batches[client_id].append((message_type, data))
             message_queue.clear()
-            for coro in coros:
-                try:
-                    await coro
-                except Exception as e:
-                    globals.handle_exception(e)
+            for client_id, batch in batches.items():
+                _send(client_id, batch)
         except Exception as e:
             globals.handle_exception(e)
             await asyncio.sleep(0.1)
+        await asyncio.sleep(globals.min_update_interval)  # NOTE: yield to the sending tasks and coalesce bursts
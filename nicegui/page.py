@@ -1,6 +1,5 @@
 import asyncio
 import inspect
-import time
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from fastapi import Request, Response
@@ -74,32 +73,37 @@ class page:
 
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         globals.app.remove_route(self.path)  # NOTE make sure only the latest route definition is used
-        parameters_of_decorated_func = list(inspect.signature(func).parameters.keys())
+        signature = inspect.signature(func)
+        parameters_of_decorated_func = set(signature.parameters.keys())
+        pass_client = 'client' in parameters_of_decorated_func
 
         async def decorated(*dec_args, **dec_kwargs) -> Response:
             request = dec_kwargs['request']
             # NOTE cleaning up the keyword args so the signature is consistent with "func" again
             dec_kwargs = {k: v for k, v in dec_kwargs.items() if k in parameters_of_decorated_func}
             with Client(self) as client:
-                if any(p.name == 'client' for p in inspect.signature(func).parameters.values()):
+                if pass_client:
                     dec_kwargs['client'] = client
                 result = func(*dec_args, **dec_kwargs)
             if inspect.isawaitable(result):
                 async def wait_for_result() -> None:
                     with client:
                         return await result
-                task = background_tasks.create(wait_for_result())
-                deadline = time.time() + self.response_timeout
-                while task and not client.is_waiting_for_connection and not task.done():
-                    if time.time() > deadline:
-                        raise TimeoutError(f'Response not ready after {self.response_timeout} seconds')
-                    await asyncio.sleep(0.1)
+                task = background_tasks.create(wait_for_result(), name=f'build page {self.path}')
+                # NOTE: the response is sent early if the page function waits for the client to connect
+                connection_task = background_tasks.create(client._get_event('waiting_for_connection').wait(),
+                                                          name=f'wait for connection to page {self.path}')
+                await asyncio.wait([task, connection_task],
+                                   timeout=self.response_timeout, return_when=asyncio.FIRST_COMPLETED)
+                connection_task.cancel()
+                if not task.done() and not client.is_waiting_for_connection:
+                    raise TimeoutError(f'Response not ready after {self.response_timeout} seconds')
                 result = task.result() if task.done() else None
             if isinstance(result, Response):  # NOTE if setup returns a response, we don't need to render the page
                 return result
             return client.build_response(request)
 
-        parameters = [p for p in inspect.signature(func).parameters.values() if p.name != 'client']
+        parameters = [p for p in signature.parameters.values() if p.name != 'client']
         # NOTE adding request as a parameter so we can pass it to the client in the decorated function
         if 'request' not in {p.name for p in parameters}:
             request = inspect.Parameter('request', inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request)
@@ -21,7 +21,6 @@ PageStickyPositions = Literal[
 
 
 class Header(ValueElement):
-
     def __init__(self, *,
                  value: bool = True,
                  fixed: bool = True,
@@ -57,7 +56,6 @@ class Header(ValueElement):
 
 
 class Drawer(Element):
-
     def __init__(self,
                  side: DrawerSides, *,
                  value: Optional[bool] = None,
@@ -106,7 +104,6 @@ class Drawer(Element):
 
 
 class LeftDrawer(Drawer):
-
     def __init__(self, *,
                  value: Optional[bool] = None,
                  fixed: bool = True,
@@ -133,7 +130,6 @@ class LeftDrawer(Drawer):
 
 
 class RightDrawer(Drawer):
-
     def __init__(self, *,
                  value: Optional[bool] = None,
                  fixed: bool = True,
@@ -160,7 +156,6 @@ class RightDrawer(Drawer):
 
 
 class Footer(ValueElement):
-
     def __init__(self, *,
                  value: bool = True,
                  fixed: bool = True,
@@ -196,7 +191,6 @@ class Footer(ValueElement):
 
 
 class PageSticky(Element):
-
     def __init__(self, position: PageStickyPositions = 'bottom-right', x_offset: float = 0, y_offset: float = 0) -> None:
         '''Page sticky
 
@@ -0,0 +1,78 @@
+from typing import Any, Optional, Set, Tuple
+
+from typing_extensions import Self
+
+
+class Props(dict):
+    """Dictionary of element props which keeps track of the keys that changed since the last transmission.
+
+    Only assignments and deletions of top-level keys are tracked.
+    Nested values which are modified in-place need to be re-assigned (or the whole element updated via `update()`).
+    """
+    __slots__ = ('changed', 'removed')
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # NOTE: the sets are created upon the first change, because most props are sent with the whole element only
+        self.changed: Optional[Set[str]] = None
+        self.removed: Optional[Set[str]] = None
+
+    def _mark_changed(self, key: str) -> None:
+        if self.changed is None:
+            self.changed = set()
+        self.changed.add(key)
+        if self.removed:
+            self.removed.discard(key)
+
+    def _mark_removed(self, key: str) -> None:
+        if self.removed is None:
+            self.removed = set()
+        self.removed.add(key)
+        if self.changed:
+            self.changed.discard(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mark_changed(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._mark_removed(key)
+
+    def __or__(self, other: Any) -> 'Props':
+        return Props({**self, **other})  # NOTE: dict.__or__ is not available before Python 3.9
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self._mark_removed(key)
+        return key, value
+
+    def clear(self) -> None:
+        for key in list(self.keys()):
+            self._mark_removed(key)
+        super().clear()
+
+    def reset_changes(self) -> None:
+        """Forget about all changes, e.g. after the complete props have been sent to the client."""
+        self.changed = None
+        self.removed = None
@@ -7,6 +7,7 @@ from typing import Any, List, Optional, Tuple
 
 import __main__
 import uvicorn
+from typing_extensions import Literal
 from uvicorn.main import STARTUP_FAILURE
 from uvicorn.supervisors import ChangeReload, Multiprocess
 
@@ -36,6 +37,10 @@ def run(*,
         dark: Optional[bool] = False,
         language: Language = 'en-US',
         binding_refresh_interval: float = 0.1,
+        min_update_interval: float = 0.0,
+        send_buffer_size: int = 10,
+        send_buffer_overflow: Literal['coalesce', 'drop', 'disconnect'] = 'coalesce',
+        transport_encoding: Literal['json', 'msgpack'] = 'json',
         show: bool = True,
         native: bool = False,
         window_size: Optional[Tuple[int, int]] = None,
@@ -61,6 +66,10 @@ def run(*,
     :param dark: whether to use Quasar's dark mode (default: `False`, use `None` for "auto" mode)
     :param language: language for Quasar elements (default: `'en-US'`)
     :param binding_refresh_interval: time between binding updates (default: `0.1` seconds, bigger is more CPU friendly)
+    :param min_update_interval: minimum time between two transmissions of UI updates (default: `0.0` seconds, bigger values coalesce bursts of updates)
+    :param send_buffer_size: maximum number of update batches waiting to be sent to a single client (default: `10`)
+    :param send_buffer_overflow: what to do if a client's send buffer is full: merge the pending element updates (`'coalesce'`, default), additionally drop pending method calls (`'drop'`) or disconnect the client (`'disconnect'`)
+    :param transport_encoding: serialization of the websocket messages, `'json'` (default) or the binary `'msgpack'` format which is more compact for numeric data but was slower to encode than JSON in `benchmarks/transport_encoding.py` (requires the `msgpack` extra)
     :param show: automatically open the UI in a browser tab (default: `True`)
     :param native: open the UI in a native window of size 800x600 (default: `False`, deactivates `show`, automatically finds an open port)
     :param window_size: open the UI in a native window with the provided size (e.g. `(1024, 786)`, default: `None`, also activates `native`)
@@ -83,6 +92,10 @@ def run(*,
     globals.dark = dark
     globals.language = language
     globals.binding_refresh_interval = binding_refresh_interval
+    globals.min_update_interval = min_update_interval
+    globals.send_buffer_size = send_buffer_size
+    globals.send_buffer_overflow = send_buffer_overflow
+    globals.transport_encoding = transport_encoding
     globals.excludes = [e.strip() for e in exclude.split(',')]
     globals.tailwind = tailwind
 
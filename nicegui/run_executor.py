@@ -0,0 +1,94 @@
+"""Run blocking functions in managed thread and process pools without blocking the event loop."""
+import asyncio
+import contextvars
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, TypeVar
+
+from . import globals
+
+if TYPE_CHECKING:
+    from .client import Client
+
+T = TypeVar('T')
+
+process_pool: Optional[ProcessPoolExecutor] = None
+thread_pool: Optional[ThreadPoolExecutor] = None
+
+
+async def cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a CPU-bound function in a separate process.
+
+    The function, its arguments and its result must be picklable, so the function has to be defined at module level.
+    If the function is called from a page and the client disconnects, pending work is cancelled.
+
+    :param func: function to run
+    :param args: positional arguments passed to the function
+    :param kwargs: keyword arguments passed to the function
+    :return: the result of the function
+    """
+    global process_pool
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor()
+    return await _run(process_pool, partial(func, *args, **kwargs))
+
+
+async def io_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run an I/O-bound function in a separate thread.
+
+    The function runs with a copy of the current context, like a task would.
+    If the function is called from a page and the client disconnects, pending work is cancelled.
+
+    :param func: function to run
+    :param args: positional arguments passed to the function
+    :param kwargs: keyword arguments passed to the function
+    :return: the result of the function
+    """
+    global thread_pool
+    if thread_pool is None:
+        thread_pool = ThreadPoolExecutor(thread_name_prefix='nicegui')
+    return await _run(thread_pool, partial(contextvars.copy_context().run, func, *args, **kwargs))
+
+
+async def _run(executor: Executor, func: Callable[[], T]) -> T:
+    future = asyncio.get_running_loop().run_in_executor(executor, func)
+    client = _get_client()
+    if client is None:
+        return await future
+    deleted = asyncio.ensure_future(client._get_event('deleted').wait())
+    waiting: List[asyncio.Future] = [future, deleted]
+    try:
+        await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    finally:
+        deleted.cancel()
+    if not future.done():
+        future.cancel()  # NOTE: work which has already started can not be interrupted, but its result is discarded
+        raise asyncio.CancelledError()
+    return future.result()
+
+
+def _get_client() -> Optional['Client']:
+    """Return the client of the current context if it can disconnect."""
+    slot_stack = globals.get_slot_stack()
+    if not slot_stack:
+        return None
+    client = slot_stack[-1].parent.client
+    return None if client.shared else client
+
+
+def tear_down() -> None:
+    """Shut down the pools without waiting for running work; pending work is cancelled."""
+    global process_pool, thread_pool
+    for pool in (process_pool, thread_pool):
+        if pool is None:
+            continue
+        if sys.version_info >= (3, 9):
+            pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            pool.shutdown(wait=False)
+    process_pool = None
+    thread_pool = None
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from fastapi import FastAPI
+from typing_extensions import Literal
 
 from nicegui import globals
 from nicegui.language import Language
@@ -15,6 +16,10 @@ def run_with(
     dark: Optional[bool] = False,
     language: Language = 'en-US',
     binding_refresh_interval: float = 0.1,
+    min_update_interval: float = 0.0,
+    send_buffer_size: int = 10,
+    send_buffer_overflow: Literal['coalesce', 'drop', 'disconnect'] = 'coalesce',
+    transport_encoding: Literal['json', 'msgpack'] = 'json',
     exclude: str = '',
     mount_path: str = '/',
 ) -> None:
@@ -25,6 +30,10 @@ def run_with(
     globals.dark = dark
     globals.language = language
     globals.binding_refresh_interval = binding_refresh_interval
+    globals.min_update_interval = min_update_interval
+    globals.send_buffer_size = send_buffer_size
+    globals.send_buffer_overflow = send_buffer_overflow
+    globals.transport_encoding = transport_encoding
     globals.excludes = [e.strip() for e in exclude.split(',')]
     globals.tailwind = True
 
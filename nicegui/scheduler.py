@@ -0,0 +1,129 @@
+"""Central scheduler which runs the callbacks of all timers from a single task."""
+import asyncio
+import heapq
+import itertools
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, Optional, Set, Tuple
+
+from . import background_tasks, globals
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .functions.timer import Timer
+
+ClientId = str
+
+CONNECTION_TIMEOUT = 60.0
+
+heap: List[Tuple[float, int, 'Timer']] = []
+client_timers: DefaultDict[ClientId, Set['Timer']] = defaultdict(set)
+waiting_timers: Dict[ClientId, List[Tuple['Timer', float]]] = {}
+suspended_timers: DefaultDict[ClientId, List[Tuple['Timer', float]]] = defaultdict(list)
+wake_event: Optional[asyncio.Event] = None
+counter = itertools.count()  # NOTE: breaks ties in the heap, so timers never need to be compared
+
+
+def schedule(timer: 'Timer', due: float) -> None:
+    """Schedule the next tick of a timer at the given time (in terms of `time.monotonic()`)."""
+    timer._due = due
+    heapq.heappush(heap, (due, next(counter), timer))
+    client_timers[timer.client.id].add(timer)
+    if wake_event is not None and heap[0][2] is timer:
+        wake_event.set()
+
+
+def schedule_when_connected(timer: 'Timer', due_in: float) -> None:
+    """Schedule a timer as soon as its client is connected.
+
+    All timers of a client share a single waiting task.
+    If the client does not connect within `CONNECTION_TIMEOUT` seconds, the timers are cancelled.
+    See https://github.com/zauberzeug/nicegui/issues/206 for details.
+    """
+    client = timer.client
+    if client.shared or client.has_socket_connection:
+        schedule(timer, time.monotonic() + due_in)
+        return
+    client_timers[client.id].add(timer)
+    if client.id not in waiting_timers:
+        waiting_timers[client.id] = []
+        background_tasks.create(_wait_for_connection(client), name=f'timers wait for {client.id}')
+    waiting_timers[client.id].append((timer, due_in))
+
+
+async def _wait_for_connection(client: 'Client') -> None:
+    try:
+        await client.connected(timeout=CONNECTION_TIMEOUT)
+    except TimeoutError:
+        # ignore served pages which do not reconnect to backend (eg. monitoring requests, scrapers etc.)
+        globals.log.error(f'Timer cancelled because client is not connected after {CONNECTION_TIMEOUT} seconds')
+        remove_client(client.id)
+        return
+    now = time.monotonic()
+    for timer, due_in in waiting_timers.pop(client.id, []):
+        if timer.callback is not None:
+            schedule(timer, now + due_in)
+
+
+def suspend(timer: 'Timer', due: float) -> None:
+    """Keep a due timer aside until its client is visible again."""
+    timer._due = None
+    suspended_timers[timer.client.id].append((timer, due))
+
+
+def resume_client(client_id: ClientId) -> None:
+    """Schedule all suspended timers of the given client; missed ticks are due immediately."""
+    now = time.monotonic()
+    for timer, due in suspended_timers.pop(client_id, []):
+        if timer.callback is not None:
+            schedule(timer, max(due, now))
+
+
+def remove_client(client_id: ClientId) -> None:
+    """Cancel all timers of the given client."""
+    waiting_timers.pop(client_id, None)
+    suspended_timers.pop(client_id, None)
+    for timer in client_timers.pop(client_id, set()):
+        timer.cleanup()
+
+
+def unschedule(timer: 'Timer') -> None:
+    """Forget about the timer; its heap entry is skipped when it becomes due."""
+    timers = client_timers.get(timer.client.id)
+    if timers is not None:
+        timers.discard(timer)
+        if not timers:
+            del client_timers[timer.client.id]
+
+
+async def loop() -> None:
+    global wake_event
+    wake_event = asyncio.Event()
+    try:
+        while True:
+            if not heap:
+                await wake_event.wait()
+            else:
+                delay = heap[0][0] - time.monotonic()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(wake_event.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+            wake_event.clear()
+            if globals.state in {globals.State.STOPPING, globals.State.STOPPED}:
+                break
+            now = time.monotonic()
+            due: List[Tuple[float, 'Timer']] = []
+            while heap and heap[0][0] <= now:
+                due_time, _, timer = heapq.heappop(heap)
+                if timer._due == due_time and timer.callback is not None:  # NOTE: skip outdated and cancelled entries
+                    due.append((due_time, timer))
+            for due_time, timer in due:
+                try:
+                    timer._tick(due_time)
+                except Exception as e:
+                    globals.handle_exception(e)
+            await asyncio.sleep(0)  # NOTE: yield to other tasks even if more timers are due
+    finally:
+        wake_event = None
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 
 class Slot:
+    __slots__ = ('name', 'parent', 'template', 'children')
 
     def __init__(self, parent: 'Element', name: str, template: Optional[str] = None) -> None:
         self.name = name
@@ -17,12 +18,11 @@ class Slot:
         self.children: List['Element'] = []
 
     def __enter__(self) -> Self:
-        globals.get_slot_stack().append(self)
+        globals.push_slot(self)
         return self
 
     def __exit__(self, *_) -> None:
-        globals.get_slot_stack().pop()
-        globals.prune_slot_stack()
+        globals.pop_slot()
 
     def __iter__(self) -> Iterator['Element']:
         return iter(self.children)
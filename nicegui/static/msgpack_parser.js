@@ -0,0 +1,213 @@
+// Socket.IO parser using MessagePack instead of JSON (compatible with python-socketio's "msgpack" serializer).
+// See https://github.com/socketio/socket.io-msgpack-parser for the reference implementation.
+(function () {
+  "use strict";
+
+  const textEncoder = new TextEncoder();
+  const textDecoder = new TextDecoder();
+
+  class Writer {
+    constructor() {
+      this.bytes = new Uint8Array(1024);
+      this.view = new DataView(this.bytes.buffer);
+      this.length = 0;
+    }
+    reserve(size) {
+      if (this.length + size <= this.bytes.length) return;
+      let capacity = this.bytes.length * 2;
+      while (capacity < this.length + size) capacity *= 2;
+      const bytes = new Uint8Array(capacity);
+      bytes.set(this.bytes);
+      this.bytes = bytes;
+      this.view = new DataView(bytes.buffer);
+    }
+    uint8(value) {
+      this.reserve(1);
+      this.bytes[this.length++] = value;
+    }
+    head(type, size, value) {
+      this.uint8(type);
+      this.reserve(size);
+      if (size === 1) this.view.setUint8(this.length, value);
+      if (size === 2) this.view.setUint16(this.length, value);
+      if (size === 4) this.view.setUint32(this.length, value);
+      this.length += size;
+    }
+    raw(bytes) {
+      this.reserve(bytes.length);
+      this.bytes.set(bytes, this.length);
+      this.length += bytes.length;
+    }
+    write(value) {
+      if (value === null || value === undefined) {
+        this.uint8(0xc0);
+      } else if (value === false) {
+        this.uint8(0xc2);
+      } else if (value === true) {
+        this.uint8(0xc3);
+      } else if (typeof value === "number") {
+        this.number(value);
+      } else if (typeof value === "string") {
+        const bytes = textEncoder.encode(value);
+        if (bytes.length < 32) this.uint8(0xa0 | bytes.length);
+        else if (bytes.length < 0x100) this.head(0xd9, 1, bytes.length);
+        else if (bytes.length < 0x10000) this.head(0xda, 2, bytes.length);
+        else this.head(0xdb, 4, bytes.length);
+        this.raw(bytes);
+      } else if (value instanceof ArrayBuffer || ArrayBuffer.isView(value)) {
+        const bytes = value instanceof ArrayBuffer ? new Uint8Array(value) : new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+        if (bytes.length < 0x100) this.head(0xc4, 1, bytes.length);
+        else if (bytes.length < 0x10000) this.head(0xc5, 2, bytes.length);
+        else this.head(0xc6, 4, bytes.length);
+        this.raw(bytes);
+      } else if (Array.isArray(value)) {
+        if (value.length < 16) this.uint8(0x90 | value.length);
+        else if (value.length < 0x10000) this.head(0xdc, 2, value.length);
+        else this.head(0xdd, 4, value.length);
+        value.forEach((item) => this.write(item));
+      } else if (typeof value.toJSON === "function") {
+        this.write(value.toJSON());
+      } else if (typeof value === "object") {
+        const entries = Object.entries(value).filter(([_, item]) => item !== undefined && typeof item !== "function");
+        if (entries.length < 16) this.uint8(0x80 | entries.length);
+        else if (entries.length < 0x10000) this.head(0xde, 2, entries.length);
+        else this.head(0xdf, 4, entries.length);
+        entries.forEach(([key, item]) => {
+          this.write(key);
+          this.write(item);
+        });
+      } else {
+        this.uint8(0xc0);
+      }
+    }
+    number(value) {
+      if (!Number.isSafeInteger(value)) {
+        this.uint8(0xcb);
+        this.reserve(8);
+        this.view.setFloat64(this.length, value);
+        this.length += 8;
+      } else if (value >= 0) {
+        if (value < 0x80) this.uint8(value);
+        else if (value < 0x100) this.head(0xcc, 1, value);
+        else if (value < 0x10000) this.head(0xcd, 2, value);
+        else if (value < 0x100000000) this.head(0xce, 4, value);
+        else {
+          this.head(0xcf, 4, Math.floor(value / 0x100000000));
+          this.reserve(4);
+          this.view.setUint32(this.length, value >>> 0);
+          this.length += 4;
+        }
+      } else {
+        if (value >= -0x20) this.uint8(value & 0xff);
+        else if (value >= -0x80) this.head(0xd0, 1, value & 0xff);
+        else if (value >= -0x8000) this.head(0xd1, 2, value & 0xffff);
+        else if (value >= -0x80000000) this.head(0xd2, 4, value >>> 0);
+        else {
+          this.head(0xd3, 4, Math.floor(value / 0x100000000) >>> 0);
+          this.reserve(4);
+          this.view.setUint32(this.length, value >>> 0);
+          this.length += 4;
+        }
+      }
+    }
+  }
+
+  function encode(value) {
+    const writer = new Writer();
+    writer.write(value);
+    return writer.bytes.slice(0, writer.length).buffer;
+  }
+
+  function decode(data) {
+    const bytes = data instanceof ArrayBuffer ? new Uint8Array(data) : new Uint8Array(data.buffer, data.byteOffset, data.byteLength);
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    let offset = 0;
+    function skip(size) {
+      offset += size;
+      return offset - size;
+    }
+    function str(length) {
+      const start = skip(length);
+      return textDecoder.decode(bytes.subarray(start, start + length));
+    }
+    function bin(length) {
+      const start = skip(length);
+      return bytes.slice(start, start + length);
+    }
+    function array(length) {
+      const result = new Array(length);
+      for (let i = 0; i < length; i++) result[i] = read();
+      return result;
+    }
+    function map(length) {
+      const result = {};
+      for (let i = 0; i < length; i++) {
+        const key = read();
+        result[key] = read();
+      }
+      return result;
+    }
+    function read() {
+      const type = bytes[skip(1)];
+      if (type < 0x80) return type;
+      if (type < 0x90) return map(type & 0x0f);
+      if (type < 0xa0) return array(type & 0x0f);
+      if (type < 0xc0) return str(type & 0x1f);
+      if (type >= 0xe0) return type - 0x100;
+      switch (type) {
+        case 0xc0: return null;
+        case 0xc2: return false;
+        case 0xc3: return true;
+        case 0xc4: return bin(view.getUint8(skip(1)));
+        case 0xc5: return bin(view.getUint16(skip(2)));
+        case 0xc6: return bin(view.getUint32(skip(4)));
+        case 0xca: return view.getFloat32(skip(4));
+        case 0xcb: return view.getFloat64(skip(8));
+        case 0xcc: return view.getUint8(skip(1));
+        case 0xcd: return view.getUint16(skip(2));
+        case 0xce: return view.getUint32(skip(4));
+        case 0xcf: return view.getUint32(skip(4)) * 0x100000000 + view.getUint32(skip(4));
+        case 0xd0: return view.getInt8(skip(1));
+        case 0xd1: return view.getInt16(skip(2));
+        case 0xd2: return view.getInt32(skip(4));
+        case 0xd3: return view.getInt32(skip(4)) * 0x100000000 + view.getUint32(skip(4));
+        case 0xd9: return str(view.getUint8(skip(1)));
+        case 0xda: return str(view.getUint16(skip(2)));
+        case 0xdb: return str(view.getUint32(skip(4)));
+        case 0xdc: return array(view.getUint16(skip(2)));
+        case 0xdd: return array(view.getUint32(skip(4)));
+        case 0xde: return map(view.getUint16(skip(2)));
+        case 0xdf: return map(view.getUint32(skip(4)));
+      }
+      throw new Error(`MessagePack type 0x${type.toString(16)} is not supported`);
+    }
+    return read();
+  }
+
+  class Encoder {
+    encode(packet) {
+      return [encode(packet)];
+    }
+  }
+
+  class Decoder {
+    constructor() {
+      this.callbacks = [];
+    }
+    on(event, callback) {
+      if (event === "decoded") this.callbacks.push(callback);
+      return this;
+    }
+    off(event, callback) {
+      if (event === "decoded") this.callbacks = callback ? this.callbacks.filter((c) => c !== callback) : [];
+      return this;
+    }
+    add(data) {
+      const packet = decode(data);
+      this.callbacks.forEach((callback) => callback(packet));
+    }
+    destroy() {}
+  }
+
+  window.msgpackParser = { protocol: 5, Encoder, Decoder, encode, decode };
+})();
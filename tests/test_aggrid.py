@@ -1,7 +1,13 @@
+import asyncio
+import sqlite3
+
+import pytest
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 from nicegui import ui
+from nicegui.elements import aggrid_sources
+from nicegui.elements.aggrid_sources import RowRequest, SqliteSource, _filter_series, _filter_sql
 
 from .screen import Screen
 
@@ -142,3 +148,120 @@ def test_create_from_pandas(screen: Screen):
     screen.should_contain('Bob')
     screen.should_contain('18')
     screen.should_contain('21')
+
+
+def test_create_from_source(screen: Screen):
+    import pandas as pd
+    df = pd.DataFrame({'name': [f'Person {i}' for i in range(10_000)], 'age': [i % 100 for i in range(10_000)]})
+    grid = ui.aggrid.from_source(df, options={'cacheBlockSize': 50})
+
+    screen.open('/')
+    screen.should_contain('Person 0')
+    screen.should_contain('Person 1')
+    screen.should_not_contain('Person 9999')
+    assert len(grid._cached_blocks) == 1
+
+
+def test_create_from_sqlite(screen: Screen):
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.execute('CREATE TABLE people (name TEXT, age INTEGER)')
+    connection.executemany('INSERT INTO people VALUES (?, ?)', [('Alice', 18), ('Bob', 21)])
+    grid = ui.aggrid.from_source(SqliteSource(connection, 'people'), options={
+        'columnDefs': [{'field': 'name'}, {'field': 'age', 'sortable': True}],
+    })
+    ui.button('Sort', on_click=lambda: grid.call_api_method('applyColumnState', {
+        'state': [{'colId': 'age', 'sort': 'desc'}],
+    }))
+
+    screen.open('/')
+    screen.should_contain('Alice')
+    screen.should_contain('Bob')
+
+    screen.click('Sort')
+    screen.wait(0.5)
+    assert screen.find('Bob').location['y'] < screen.find('Alice').location['y']
+
+
+async def test_async_iterable_source():
+    async def rows():
+        for i in range(250):
+            yield {'id': i}
+
+    source = aggrid_sources.create(rows())
+    assert await source.get_rows(RowRequest(start_row=0, end_row=100, sort_model=[], filter_model={})) == \
+        ([{'id': i} for i in range(100)], None)
+    assert await source.get_rows(RowRequest(start_row=200, end_row=300, sort_model=[], filter_model={})) == \
+        ([{'id': i} for i in range(200, 250)], 250)
+
+
+def test_filter_series():
+    import pandas as pd
+    series = pd.Series(['Alice', 'Bob', 'alfred', '', None])
+    numbers = pd.Series([1, 5, 10, 20])
+
+    def matches(series: pd.Series, model: dict) -> list:
+        return series[_filter_series(series, model)].tolist()
+    assert matches(series, {'filterType': 'text', 'type': 'contains', 'filter': 'AL'}) == ['Alice', 'alfred']
+    assert matches(series, {'filterType': 'text', 'type': 'startsWith', 'filter': 'b'}) == ['Bob']
+    assert matches(series, {'filterType': 'text', 'type': 'equals', 'filter': 'bob'}) == ['Bob']
+    assert _filter_series(series, {'filterType': 'text', 'type': 'blank'}).tolist() == [False, False, False, True, True]
+    assert matches(series, {'filterType': 'set', 'values': ['Bob', 'alfred']}) == ['Bob', 'alfred']
+    assert matches(numbers, {'filterType': 'number', 'type': 'greaterThanOrEqual', 'filter': 10}) == [10, 20]
+    assert matches(numbers, {'filterType': 'number', 'type': 'inRange', 'filter': 1, 'filterTo': 20}) == [5, 10]
+    assert matches(numbers, {'filterType': 'number', 'operator': 'OR', 'conditions': [
+        {'filterType': 'number', 'type': 'lessThan', 'filter': 5},
+        {'filterType': 'number', 'type': 'greaterThan', 'filter': 10},
+    ]}) == [1, 20]
+    with pytest.raises(ValueError):
+        _filter_series(numbers, {'filterType': 'number', 'type': 'unknown'})
+
+
+def test_filter_sql():
+    assert _filter_sql('"name"', {'filterType': 'text', 'type': 'contains', 'filter': '50%'}) == \
+        ("\"name\" LIKE ? ESCAPE '\\'", ['%50\\%%'])
+    assert _filter_sql('"name"', {'filterType': 'text', 'type': 'notEqual', 'filter': 'Bob'}) == \
+        ('LOWER("name") != LOWER(?)', ['Bob'])
+    assert _filter_sql('"age"', {'filterType': 'set', 'values': [18, 21]}) == ('"age" IN (?, ?)', [18, 21])
+    assert _filter_sql('"age"', {'filterType': 'number', 'operator': 'AND', 'condition1': {
+        'filterType': 'number', 'type': 'greaterThan', 'filter': 18,
+    }, 'condition2': {
+        'filterType': 'number', 'type': 'lessThanOrEqual', 'filter': 65,
+    }}) == ('("age" > ? AND "age" <= ?)', [18, 65])
+    with pytest.raises(ValueError):
+        _filter_sql('"age"', {'filterType': 'date', 'type': 'equals'})
+
+
+async def test_sqlite_source():
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.execute('CREATE TABLE people (name TEXT, age INTEGER)')
+    connection.executemany('INSERT INTO people VALUES (?, ?)', [(f'Person {i}', i % 50) for i in range(200)])
+    source = SqliteSource(connection, 'SELECT * FROM people WHERE age >= ?', [10])
+    assert source.columns == ['name', 'age']
+
+    rows, count = await source.get_rows(RowRequest(start_row=0, end_row=3, sort_model=[{'colId': 'age', 'sort': 'desc'}],
+                                                   filter_model={}))
+    assert count == 160
+    assert [row['age'] for row in rows] == [49, 49, 49]
+
+    age_filter = {'age': {'filterType': 'number', 'type': 'lessThan', 'filter': 12}}
+    rows, count = await source.get_rows(RowRequest(start_row=0, end_row=100, sort_model=[], filter_model=age_filter))
+    assert count == 8
+    assert {row['age'] for row in rows} == {10, 11}
+
+    connection.execute("INSERT INTO people VALUES ('Newcomer', 10)")
+    assert (await source.get_rows(RowRequest(start_row=0, end_row=1, sort_model=[], filter_model=age_filter)))[1] == 8
+    source.clear_cache()
+    assert (await source.get_rows(RowRequest(start_row=0, end_row=1, sort_model=[], filter_model=age_filter)))[1] == 9
+
+
+async def test_data_frame_source_with_concurrent_requests():
+    import pandas as pd
+    source = aggrid_sources.create(pd.DataFrame({'number': range(1000)}))
+    ascending = RowRequest(start_row=0, end_row=2, sort_model=[{'colId': 'number', 'sort': 'asc'}], filter_model={})
+    descending = RowRequest(start_row=0, end_row=2, sort_model=[{'colId': 'number', 'sort': 'desc'}], filter_model={})
+    results = await asyncio.gather(source.get_rows(ascending), source.get_rows(descending), source.get_rows(ascending))
+    assert results == [
+        ([{'number': 0}, {'number': 1}], 1000),
+        ([{'number': 999}, {'number': 998}], 1000),
+        ([{'number': 0}, {'number': 1}], 1000),
+    ]
@@ -1,8 +1,9 @@
 import asyncio
+import threading
 
 from selenium.webdriver.common.by import By
 
-from nicegui import Client, app, background_tasks, ui
+from nicegui import Client, app, background_tasks, globals, ui
 
 from .screen import Screen
 
@@ -133,3 +134,19 @@ def test_adding_elements_from_different_tasks(screen: Screen):
     c1.find_element(By.XPATH, './/*[contains(text(), "1")]')
     c2 = screen.find_by_id(card2.id)
     c2.find_element(By.XPATH, './/*[contains(text(), "2")]')
+
+
+async def test_slot_stack_is_inherited_by_tasks():
+    with ui.card() as card:
+        async def add_label() -> ui.label:
+            return ui.label('from task')
+        label = await asyncio.create_task(add_label())
+    assert label.parent_slot is card.default_slot
+
+    def get_stack_in_thread() -> tuple:
+        result = []
+        thread = threading.Thread(target=lambda: result.append(globals.get_slot_stack()))
+        thread.start()
+        thread.join()
+        return result[0]
+    assert get_stack_in_thread() == ()
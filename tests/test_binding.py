@@ -1,7 +1,9 @@
+import gc
+import weakref
 
 from selenium.webdriver.common.keys import Keys
 
-from nicegui import ui
+from nicegui import binding, ui
 
 from .screen import Screen
 
@@ -83,3 +85,80 @@ def test_binding_to_input(screen: Screen):
     element.value = 'five'
     screen.should_contain_input('five')
     assert data.text == 'five'
+
+
+def test_bindable_dataclass():
+    @binding.bindable_dataclass
+    class Model:
+        name: str = 'Alice'
+        age: int = 42
+
+    model = Model()
+    active_links = len(binding.active_links)
+    label = ui.label().bind_text_from(model, 'name')
+    number = ui.number().bind_value(model, 'age')
+    assert len(binding.active_links) == active_links
+    assert label.text == 'Alice'
+
+    model.name = 'Bob'
+    assert label.text == 'Bob'
+    number.value = 43
+    assert model.age == 43
+    assert model == Model(name='Bob', age=43)
+
+
+def test_bindable_dict():
+    data = binding.BindableDict(name='Alice')
+    active_links = len(binding.active_links)
+    label = ui.label().bind_text_from(data, 'name')
+    assert len(binding.active_links) == active_links
+    assert label.text == 'Alice'
+
+    data['name'] = 'Bob'
+    assert label.text == 'Bob'
+    data.update(name='Carol')
+    assert label.text == 'Carol'
+
+    del data['name']
+    assert (id(data), 'name') not in binding.bindable_properties
+    data['name'] = 'Dave'
+    assert label.text == 'Dave', 'bindings of deleted items take effect again'
+
+    data.clear()
+    data.update(name='Eve')
+    assert label.text == 'Eve'
+    assert (id(data), 'name') in binding.bindable_properties
+    assert len(binding.active_links) == active_links
+
+
+def test_forget_garbage_collected_objects():
+    @binding.bindable_dataclass
+    class Model:
+        name: str = 'Alice'
+
+    objects = [Model(), binding.BindableDict(name='Alice')]
+    ids = [id(obj) for obj in objects]
+    refs = [weakref.ref(obj) for obj in objects]
+    assert all((obj_id, 'name') in binding.bindable_properties for obj_id in ids)
+
+    del objects
+    gc.collect()
+    assert all(ref() is None for ref in refs), 'bindable objects are not kept alive'
+    assert all((obj_id, 'name') not in binding.bindable_properties for obj_id in ids)
+
+
+def test_remove_bindings():
+    data = {'name': 'Alice'}
+    active_links = len(binding.active_links)
+    with ui.row() as row:
+        label = ui.label().bind_text_from(data, 'name')
+        ui.input().bind_value(label, 'text')
+    other = ui.label().bind_text_from(data, 'name')
+    assert len(binding.active_links) == active_links + 2
+
+    row.clear()
+    assert len(binding.active_links) == active_links + 1
+    assert (id(label), 'text') not in binding.bindings
+    assert (id(label), 'text') not in binding.bindable_properties
+    assert id(label) not in binding.object_bindings
+    assert [target for _, target, _, _ in binding.bindings[(id(data), 'name')].values()] == [other]
@@ -161,3 +161,42 @@ def test_move(screen: Screen):
     screen.click('Move X to top')
     screen.wait(0.5)
     assert screen.find('X').location['y'] < screen.find('A').location['y'] < screen.find('B').location['y']
+
+
+def test_patch():
+    element = ui.element('div')
+    element._reset_changes()
+    assert element._to_patch() == {'id': element.id}
+
+    element.classes('one').props('color=red')
+    assert element._to_patch() == {'id': element.id, 'class': ['one'], 'props': {'color': 'red'}}
+
+    element.props(remove='color')
+    assert element._to_patch() == {'id': element.id, 'removed_props': ['color']}
+
+
+def test_cached_serialization():
+    element = ui.element('div')
+    serialized = element._to_dict()
+    assert element._to_dict() is serialized
+
+    element.props('color=red')
+    assert element._to_dict() is serialized
+    assert serialized['props']['color'] == 'red'
+
+    with element:
+        child = ui.label('Hello')
+    updated = element._to_dict()
+    assert updated is not serialized
+    assert updated['slots']['default']['ids'] == [child.id]
+    assert updated['events'] is serialized['events']
+
+
+def test_custom_attributes_and_props():
+    label = ui.label('Hello')
+    label.custom = 42
+    assert label.custom == 42
+
+    label._props = {'color': 'red'}
+    label.props('dense')
+    assert label._to_dict()['props'] == {'color': 'red', 'dense': True}
@@ -150,3 +150,39 @@ def test_throttling_variants(screen: Screen):
     assert events == []
     screen.wait(1.1)
     assert events == [3]
+
+
+def test_coalesce_events(screen: Screen):
+    handled = []
+
+    async def handle(e):
+        await asyncio.sleep(0.5)
+        handled.append(e['args']['count'])
+
+    label = ui.label('Label').on('click', handle, ['count'], coalesce=True)
+    listener_id = list(label._event_listeners)[0]
+
+    screen.open('/')
+    for count in range(5):
+        screen.selenium.execute_script(
+            f'window.socket.emit("event", {{id: {label.id}, listener_id: "{listener_id}", args: {{count: {count}}}}})')
+    screen.wait(1.5)
+    assert handled == [0, 4], 'only the first and the latest event are handled'
+
+
+def test_cancel_previous_events(screen: Screen):
+    handled = []
+
+    async def handle(e):
+        await asyncio.sleep(0.5)
+        handled.append(e['args']['count'])
+
+    label = ui.label('Label').on('click', handle, ['count'], cancel_previous=True)
+    listener_id = list(label._event_listeners)[0]
+
+    screen.open('/')
+    for count in range(5):
+        screen.selenium.execute_script(
+            f'window.socket.emit("event", {{id: {label.id}, listener_id: "{listener_id}", args: {{count: {count}}}}})')
+    screen.wait(1.0)
+    assert handled == [4], 'only the latest event is handled completely'
@@ -76,3 +76,24 @@ def test_canceling_schedule_browser(monkeypatch):
     time.sleep(0.2)
     assert not thread.is_alive()
     assert called_with_url is None
+
+
+def test_get_signature():
+    def handler(a, b=1):
+        pass
+
+    assert helpers.get_signature(handler) is helpers.get_signature(handler), 'signature is cached'
+    assert helpers.expects_arguments(handler)
+    assert not helpers.expects_arguments(lambda x=0: None)
+
+    class Handler:
+        def __call__(self, a):
+            pass
+
+        def method(self, a):
+            pass
+
+    assert helpers.expects_arguments(Handler()), 'callable objects are supported as well'
+    assert list(helpers.get_signature(Handler().method).parameters) == ['a']
+    assert helpers.get_signature(Handler().method) is helpers.get_signature(Handler().method), 'bound method is cached'
+    assert list(helpers.get_signature(Handler.method).parameters) == ['self', 'a']
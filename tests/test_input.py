@@ -1,3 +1,5 @@
+import asyncio
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
@@ -118,3 +120,19 @@ def test_clearable_input(screen: Screen):
     screen.should_contain('value: foo')
     screen.click('cancel')
     screen.should_contain('value: None')
+
+
+def test_cancel_previous_change_handler(screen: Screen):
+    handled = []
+
+    async def handle_change(e):
+        await asyncio.sleep(0.5)
+        handled.append(e.value)
+
+    ui.input(on_change=handle_change, cancel_previous=True)
+
+    screen.open('/')
+    element = screen.selenium.find_element(By.XPATH, '//input')
+    element.send_keys('abc')
+    screen.wait(1.0)
+    assert handled == ['abc'], 'only the handler of the latest change completes'
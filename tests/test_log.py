@@ -54,3 +54,27 @@ def test_special_characters(screen: Screen):
     screen.should_contain('50%')
     screen.click('push')
     screen.should_contain('100%')
+
+
+def test_push_many_lines_at_once(screen: Screen):
+    log = ui.log(max_lines=3)
+    ui.button('push', on_click=lambda: [log.push(f'Line {i}') for i in range(1000)])
+
+    screen.open('/')
+    screen.click('push')
+    screen.wait(0.5)
+    assert screen.find_by_id(log.id).text == 'Line 997\nLine 998\nLine 999'
+    assert list(log.lines) == ['Line 997', 'Line 998', 'Line 999']
+
+
+def test_fetch_history_when_scrolling_up(screen: Screen):
+    log = ui.log()
+    for i in range(10_000):
+        log.push(f'Line {i}')
+
+    screen.open('/')
+    screen.should_contain('Line 9999')
+    screen.should_not_contain('Line 0')
+
+    screen.selenium.execute_script(f'document.getElementById({log.id}).scrollTop = 0')
+    screen.should_contain('Line 0')
@@ -0,0 +1,81 @@
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import msgpack
+import numpy as np
+from socketio.packet import EVENT
+
+from nicegui import ui
+from nicegui.msgpack_packet import MsgPackPacket
+
+from .screen import Screen
+
+PARSER = (Path(__file__).parent.parent / 'nicegui' / 'static' / 'msgpack_parser.js').read_text()
+
+
+def round_trip(data: Any) -> Any:
+    encoded = MsgPackPacket(EVENT, data=data, namespace='/').encode()
+    return MsgPackPacket(encoded_packet=encoded).data
+
+
+def test_round_trip():
+    data = ['batch', [['update', {'1': {'id': 1, 'tag': 'div', 'text': 'Grüße 🚀', 'props': {
+        'count': -3, 'ratio': 0.5, 'big': 2**40, 'negative': -2**40, 'none': None, 'flag': True, 'list': list(range(20)),
+    }}}]]]
+    assert round_trip(data) == data
+
+
+def test_binary_payloads():
+    data = ['event', {'small': b'\x00\xff', 'medium': bytes(range(256)) * 2, 'large': bytes(range(256)) * 300}]
+    assert round_trip(data) == data
+
+
+def test_non_string_map_keys():
+    data = ['batch', [['update', {1: {'id': 1}, 2: {'id': 2}}], ['patch', {-3: {'id': -3}, 0.5: {'id': 0.5}}]]]
+    assert round_trip(data) == data
+
+
+def test_numpy_and_other_types():
+    data = {
+        'array': np.array([[1, 2], [3, 4]]),
+        'scalar': np.float32(0.5),
+        'date': date(2023, 4, 1),
+        'datetime': datetime(2023, 4, 1, 12, 30),
+        'decimal': Decimal('1.5'),
+    }
+    assert round_trip(data) == {
+        'array': [[1, 2], [3, 4]],
+        'scalar': 0.5,
+        'date': '2023-04-01',
+        'datetime': '2023-04-01T12:30:00',
+        'decimal': 1.5,
+    }
+
+
+def test_javascript_parser(screen: Screen):
+    ui.label('Hello')
+    data = {
+        'id': 1,
+        'text': 'Grüße 🚀' * 100,
+        'numbers': [0, 127, 128, 255, 65536, 2**40, -1, -32, -33, -200, -40000, -2**40, 0.5, -1.25],
+        'flags': [True, False, None],
+        'nested': {f'key {i}': list(range(i)) for i in range(20)},
+    }
+
+    screen.open('/')
+    decoded, encoded = screen.selenium.execute_script(PARSER + '''
+        const parser = window.msgpackParser;
+        const decoded = parser.decode(new Uint8Array(arguments[0]));
+        return [decoded, Array.from(new Uint8Array(parser.encode(decoded)))];
+    ''', list(msgpack.packb(data)))
+    assert decoded == data
+    assert msgpack.unpackb(bytes(encoded)) == data
+
+    binary, keys = screen.selenium.execute_script(PARSER + '''
+        const parser = window.msgpackParser;
+        return [Array.from(parser.decode(new Uint8Array(arguments[0]))), parser.decode(new Uint8Array(arguments[1]))];
+    ''', list(msgpack.packb(bytes(range(256)) * 300)), list(msgpack.packb({1: 'one', -2: 'minus two'})))
+    assert binary == list(range(256)) * 300
+    assert keys == {'1': 'one', '-2': 'minus two'}
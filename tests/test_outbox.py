@@ -0,0 +1,115 @@
+import asyncio
+
+from nicegui import Client, globals, outbox, ui
+from nicegui.page import page
+
+
+def test_coalesce_updates_and_patches():
+    batches = [
+        [('update', {1: {'id': 1, 'tag': 'div', 'text': 'A', 'props': {'a': 1}}}), ('patch', {2: {'id': 2, 'text': 'B'}})],
+        [('patch', {1: {'id': 1, 'text': 'C', 'props': {'b': 2}, 'removed_props': ['a']}})],
+        [('patch', {2: {'id': 2, 'props': {'c': 3}}}), ('notify', {'message': 'Hi'})],
+    ]
+    assert outbox._coalesce(batches) == [
+        ('update', {1: {'id': 1, 'tag': 'div', 'text': 'C', 'props': {'b': 2}}}),
+        ('patch', {2: {'id': 2, 'text': 'B', 'props': {'c': 3}}}),
+        ('notify', {'message': 'Hi'}),
+    ]
+
+
+def test_coalesce_removed_props():
+    batches = [
+        [('patch', {1: {'id': 1, 'removed_props': ['a', 'b']}})],
+        [('patch', {1: {'id': 1, 'props': {'a': 1}}})],
+    ]
+    assert outbox._coalesce(batches) == [('patch', {1: {'id': 1, 'props': {'a': 1}, 'removed_props': ['b']}})]
+
+
+def test_coalesce_drops_run_method():
+    batches = [
+        [('run_method', {'id': 1, 'name': 'push', 'args': []}), ('run_javascript', {'code': '', 'request_id': None})],
+        [('run_method', {'id': 1, 'name': 'push', 'args': []})],
+    ]
+    assert outbox._coalesce(batches, drop_run_method=True) == [('run_javascript', {'code': '', 'request_id': None})]
+    assert len(outbox._coalesce(batches)) == 3
+
+
+def test_park_updates_of_hidden_clients():
+    client = Client(page(''))
+    with client:
+        label = ui.label('A')
+    outbox.update_queue.clear()
+    outbox.patch_queue.clear()
+    client.is_hidden = True
+    label.set_text('B')
+    outbox.enqueue_message('notify', 'Hi', client.id)
+    outbox.enqueue_message('run_javascript', {'code': '', 'request_id': 'abc'}, client.id)
+
+    outbox._park_hidden_clients()
+    assert client.id not in outbox.patch_queue, 'updates of hidden clients are parked'
+    assert list(outbox.message_queue) == [(client.id, 'run_javascript', {'code': '', 'request_id': 'abc'})], \
+        'awaited JavaScript is not parked'
+
+    client.is_hidden = False
+    outbox.resume_client(client.id)
+    assert list(outbox.patch_queue[client.id]) == [label.id]
+    assert outbox.message_queue[0] == (client.id, 'notify', 'Hi')
+    outbox.remove_client(client.id)
+    outbox.patch_queue.clear()
+    outbox.message_queue.clear()
+
+
+def test_coalesce_keeps_message_order():
+    batches = [
+        [('run_javascript', {'code': 'first', 'request_id': None}), ('update', {1: {'id': 1, 'tag': 'scene'}})],
+        [('run_method', {'id': 1, 'name': 'init', 'args': []}), ('patch', {1: {'id': 1, 'props': {'a': 1}}})],
+    ]
+    assert outbox._coalesce(batches) == [
+        ('run_javascript', {'code': 'first', 'request_id': None}),
+        ('update', {1: {'id': 1, 'tag': 'scene', 'props': {'a': 1}}}),
+        ('run_method', {'id': 1, 'name': 'init', 'args': []}),
+    ]
+
+
+async def test_send_buffer_overflow(monkeypatch):
+    monkeypatch.setattr(globals, 'send_buffer_size', 2)
+    outbox.send_tasks['slow'] = asyncio.ensure_future(asyncio.sleep(10))  # NOTE: pretend the client is still busy
+    for overflow, expected in [
+        ('coalesce', [('patch', {1: {'id': 1, 'text': 'C'}}), ('run_method', {'id': 1, 'name': 'push', 'args': []})]),
+        ('drop', [('patch', {1: {'id': 1, 'text': 'C'}})]),
+    ]:
+        monkeypatch.setattr(globals, 'send_buffer_overflow', overflow)
+        outbox._send('slow', [('patch', {1: {'id': 1, 'text': 'A'}})])
+        outbox._send('slow', [('run_method', {'id': 1, 'name': 'push', 'args': []})])
+        assert outbox.queue_depth('slow') == 2
+        outbox._send('slow', [('patch', {1: {'id': 1, 'text': 'C'}})])
+        assert list(outbox.send_queues['slow']) == [expected]
+        outbox.send_queues['slow'].clear()
+    outbox.remove_client('slow')
+
+
+async def test_disconnect_on_send_buffer_overflow(monkeypatch):
+    disconnected = []
+
+    async def disconnect(sid: str) -> None:
+        disconnected.append(sid)
+    monkeypatch.setattr(globals, 'loop', asyncio.get_running_loop())
+    monkeypatch.setattr(globals, 'send_buffer_size', 1)
+    monkeypatch.setattr(globals, 'send_buffer_overflow', 'disconnect')
+    monkeypatch.setattr(globals.sio, 'disconnect', disconnect)
+    monkeypatch.setattr(outbox, '_get_participants', lambda client_id: [('sid', 'eio_sid')])
+    sending = asyncio.ensure_future(asyncio.sleep(10))
+    outbox.send_tasks['slow'] = sending
+    outbox._send('slow', [('patch', {1: {'id': 1, 'text': 'A'}})])
+    outbox._send('slow', [('patch', {1: {'id': 1, 'text': 'B'}})])
+    await asyncio.sleep(0)
+    assert disconnected == ['sid']
+    assert 'slow' not in outbox.send_queues
+    assert 'slow' not in outbox.send_tasks
+    assert sending.cancelled()
+
+
+async def test_wait_for_transport_without_engine_io_internals(monkeypatch):
+    monkeypatch.setattr(outbox, '_get_participants', lambda client_id: [('sid', 'eio_sid')])
+    monkeypatch.setattr(globals.sio, 'eio', object())
+    await asyncio.wait_for(outbox._wait_for_transport('client'), timeout=0.1)
@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+import pytest
+
+from nicegui import Client, globals, run_executor
+from nicegui.page import page
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+async def test_run_functions():
+    assert await run_executor.io_bound(add, 1, 2) == 3
+    assert await run_executor.cpu_bound(add, 1, b=2) == 3
+    run_executor.tear_down()
+
+
+async def test_io_bound_keeps_context():
+    client = Client(page(''))
+    with client:
+        assert await run_executor.io_bound(globals.get_client) is client
+        assert globals.get_client() is client
+
+
+async def test_cancel_when_client_disconnects():
+    client = Client(page(''))
+    with client:
+        task = asyncio.ensure_future(run_executor.io_bound(time.sleep, 0.5))
+    await asyncio.sleep(0.1)
+    client.handle_deletion()
+    with pytest.raises(asyncio.CancelledError):
+        await task
@@ -1,6 +1,10 @@
+import asyncio
+import threading
+
 from selenium.webdriver.common.by import By
 
-from nicegui import ui
+from nicegui import globals, ui
+from nicegui.elements.table import Table, TableRequest
 
 from .screen import Screen
 
@@ -102,3 +106,106 @@ def test_single_selection(screen: Screen):
     screen.find('Bob').find_element(By.XPATH, 'preceding-sibling::td').click()
     screen.wait(0.5)
     screen.should_contain('1 record selected.')
+
+
+def test_keyed_row_operations(screen: Screen):
+    table = ui.table(columns=columns(), rows=rows())
+    ui.button('Insert', on_click=lambda: table.insert_rows(1, {'id': 3, 'name': 'Carol', 'age': 32}))
+    ui.button('Update', on_click=lambda: table.update_rows({'id': 1, 'name': 'Robert'}))
+    ui.button('Remove', on_click=lambda: table.remove_rows_by_key(0, 2))
+
+    screen.open('/')
+    screen.click('Insert')
+    screen.should_contain('Carol')
+    assert [row['name'] for row in table.rows] == ['Alice', 'Carol', 'Bob', 'Lionel']
+
+    screen.click('Update')
+    screen.should_contain('Robert')
+    screen.should_not_contain('Bob')
+    assert table.get_row(1) == {'id': 1, 'name': 'Robert', 'age': 21}
+
+    screen.click('Remove')
+    screen.wait(0.5)
+    screen.should_not_contain('Alice')
+    screen.should_not_contain('Lionel')
+    screen.should_contain('Carol')
+    assert [row['id'] for row in table.rows] == [3, 1]
+
+
+def test_server_side_pagination(screen: Screen):
+    table = ui.table.from_source(columns(), [{'id': i, 'name': f'Person {i}', 'age': i % 50} for i in range(1000)],
+                                 pagination=10)
+    ui.input('Search by name').bind_value(table, 'filter')
+
+    screen.open('/')
+    screen.should_contain('1-10 of 1000')
+    screen.should_contain('Person 9')
+    assert len(table.rows) == 10
+
+    screen.find('Age').click()
+    screen.should_contain('Person 50')
+    assert [row['age'] for row in table.rows] == [0] * 10
+
+    element = screen.selenium.find_element(By.XPATH, '//*[@aria-label="Search by name"]')
+    element.send_keys('99')
+    screen.should_contain('1-10 of 19')
+    screen.should_contain('Person 998')
+
+
+def test_async_source(screen: Screen):
+    async def get_rows(request: TableRequest):
+        await asyncio.sleep(0.1)
+        return [{'id': request.start, 'name': f'Page {request.page}', 'age': 0}], 42
+
+    ui.table.from_source(columns(), get_rows, pagination=1)
+
+    screen.open('/')
+    screen.should_contain('Page 1')
+    screen.should_contain('1-1 of 42')
+
+
+def test_rows_without_key(screen: Screen):
+    table = ui.table(columns=columns(), rows=[{'name': 'Alice', 'age': 18}])
+    ui.button('Add', on_click=lambda: table.add_rows({'name': 'Bob', 'age': 21}))
+
+    screen.open('/')
+    screen.should_contain('Alice')
+
+    screen.click('Add')
+    screen.should_contain('Bob')
+    assert table.get_row('Bob') is None
+
+
+async def test_refresh_while_requesting(monkeypatch):
+    monkeypatch.setattr(globals, 'loop', asyncio.get_running_loop())
+    sorting = threading.Event()
+    proceed = threading.Event()
+    order_source = Table._order_source
+
+    def blocking_order_source(table: Table, request: TableRequest):
+        if request.sort_by and not proceed.is_set():
+            sorting.set()
+            proceed.wait(timeout=5)
+        return order_source(table, request)
+    monkeypatch.setattr(Table, '_order_source', blocking_order_source)
+
+    people = [{'name': f'Person {i}', 'age': i} for i in range(100)]
+    table = ui.table.from_source(columns(), people, row_key='name')
+    while not table.rows:
+        await asyncio.sleep(0.01)
+
+    pagination = {'page': 1, 'rowsPerPage': 10, 'sortBy': 'age', 'descending': True}
+    request = asyncio.ensure_future(table._handle_request({'args': {'pagination': pagination, 'filter': None}}))
+    while not sorting.is_set():
+        await asyncio.sleep(0.01)
+    people.append({'name': 'Newcomer', 'age': 100})
+    table.refresh()
+    while table._props['pagination']['rowsNumber'] != 101:
+        await asyncio.sleep(0.01)
+    proceed.set()
+    await request
+    assert table._props['pagination']['rowsNumber'] == 101, 'the outdated page is dropped'
+    assert table._ordered_source is not None and table._ordered_source[0] == (None, None, False)
+
+    await table._handle_request({'args': {'pagination': pagination, 'filter': None}})
+    assert table.rows[0]['name'] == 'Newcomer'
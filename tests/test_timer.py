@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from nicegui import ui
@@ -58,3 +60,68 @@ def test_setting_visibility(screen: Screen, once: bool):
     screen.open('/')
     screen.wait(0.5)
     screen.should_not_contain('Some Label')
+
+
+def test_timer_does_not_drift(screen: Screen):
+    timestamps = []
+
+    def tick():
+        timestamps.append(time.monotonic())
+        time.sleep(0.03)
+
+    ui.timer(0.1, tick)
+
+    screen.start_server()
+    screen.wait(1.05)
+    assert len(timestamps) >= 10, 'slow callbacks do not delay the following ticks'
+    deviations = [t - timestamps[0] - 0.1 * i for i, t in enumerate(timestamps)]
+    assert max(deviations) < 0.05, 'ticks are scheduled relative to the first tick'
+
+
+def test_cancel_timer(screen: Screen):
+    counter = Counter()
+    timer = ui.timer(0.1, counter.increment)
+    ui.button('Cancel', on_click=timer.cancel)
+
+    screen.open('/')
+    screen.wait(0.5)
+    screen.click('Cancel')
+    screen.wait(0.1)
+    count = counter.value
+    screen.wait(0.5)
+    assert counter.value == count, 'timer is not running anymore after cancelling it'
+
+
+def test_pause_timer_while_page_is_hidden(screen: Screen):
+    counter = Counter()
+
+    @ui.page('/')
+    def page():
+        ui.timer(0.1, counter.increment, pause_when_hidden=True)
+
+    screen.open('/')
+    screen.wait(0.5)
+    screen.selenium.execute_script('window.socket.emit("visibility", {visible: false})')
+    screen.wait(0.2)
+    count = counter.value
+    screen.wait(0.5)
+    assert counter.value == count, 'timer is paused while the page is hidden'
+
+    screen.selenium.execute_script('window.socket.emit("visibility", {visible: true})')
+    screen.wait(0.5)
+    assert counter.value > count, 'timer is running again after the page is visible'
+
+
+def test_timer_keeps_running_after_an_exception(screen: Screen):
+    counter = Counter()
+
+    def tick():
+        counter.increment()
+        raise RuntimeError('failing tick')
+
+    ui.timer(0.1, tick)
+
+    screen.start_server()
+    screen.wait(0.55)
+    assert counter.value >= 3, 'the timer is rescheduled although the callback raised an exception'
+    screen.caplog.clear()
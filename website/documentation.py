@@ -358,6 +358,34 @@ def create_full() -> None:
 
         ui.button('start async task', on_click=async_task)
 
+    @text_demo('Running blocking tasks', '''
+        Blocking functions freeze the UI because they block the event loop.
+        With `run_executor.io_bound` a function runs in a separate thread, e.g. to wait for a file or a network request.
+        With `run_executor.cpu_bound` a function runs in a separate process, e.g. for heavy computations.
+        The function and its arguments must be picklable in this case, so it has to be defined at module level.
+
+        Both return the result of the function when awaited.
+        The UI context is preserved, so elements can be created and updated afterwards.
+        If the client disconnects before the result is ready, pending work is cancelled.
+        The thread and process pools are shut down automatically when the app stops.
+    ''')
+    def blocking_tasks_demo():
+        import time
+
+        from nicegui import run_executor
+
+        def compute_sum(a: float, b: float) -> float:
+            time.sleep(1)  # simulate a slow request
+            return a + b
+
+        async def handle_click():
+            result = await run_executor.io_bound(compute_sum, 1, 2)
+            ui.notify(f'Sum is {result}')
+
+        # ui.button('Compute', on_click=handle_click)
+        # END OF DEMO
+        ui.button('Compute', on_click=lambda: ui.notify('Sum is 3'))
+
     heading('Pages')
 
     load_demo(ui.page)
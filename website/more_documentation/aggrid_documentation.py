@@ -138,3 +138,22 @@ def more() -> None:
 
         df = pd.DataFrame(data={'col1': [1, 2], 'col2': [3, 4]})
         ui.aggrid.from_pandas(df).classes('max-h-40')
+
+    @text_demo('Load rows on demand', '''
+        For large data, `from_source` creates a grid using AG Grid's infinite row model.
+        The grid requests blocks of rows while scrolling, which are answered by a data source on the server.
+        The source can be a Pandas DataFrame, an async iterable or a function receiving a `RowRequest`.
+        Use `SqliteSource` from `nicegui.elements.aggrid_sources` to push sorting and filtering down to an SQLite database.
+        Its queries run in a separate thread, so the connection must be created with `check_same_thread=False`.
+    ''')
+    def aggrid_from_source():
+        import pandas as pd
+
+        df = pd.DataFrame(data={'number': range(100_000)})
+        df['square'] = df['number'] ** 2
+        ui.aggrid.from_source(df, options={
+            'columnDefs': [
+                {'field': 'number', 'sortable': True, 'filter': 'agNumberColumnFilter'},
+                {'field': 'square', 'sortable': True},
+            ],
+        }).classes('max-h-40')
@@ -52,3 +52,26 @@ def more() -> None:
                 ui.date(on_change=lambda: ui.notify(f'Date: {date}')).bind_value(date_input)
             with date_input.add_slot('append'):
                 ui.icon('edit_calendar').on('click', menu.open).classes('cursor-pointer')
+
+    @text_demo('Bindable dataclasses and dictionaries', '''
+        Bindings to plain objects and dictionaries are checked for changes periodically.
+        Fields of a `bindable_dataclass` and items of a `BindableDict` notify their bindings immediately instead,
+        so they do not cost any CPU time while nothing changes.
+    ''')
+    def bindable_dataclass():
+        from nicegui.binding import BindableDict, bindable_dataclass
+
+        @bindable_dataclass
+        class Counter:
+            value: int = 0
+
+        counter = Counter()
+        data = BindableDict(clicks=0)
+
+        def count():
+            counter.value += 1
+            data['clicks'] += 1
+
+        ui.label().bind_text_from(counter, 'value', backward=lambda v: f'Counter: {v}')
+        ui.label().bind_text_from(data, 'clicks', backward=lambda c: f'Clicks: {c}')
+        ui.button('Count', on_click=count)
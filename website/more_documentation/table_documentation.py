@@ -160,3 +160,18 @@ def more() -> None:
             {'name': 'count', 'label': 'Count', 'field': 'count'},
         ]
         table = ui.table(columns=columns, rows=[], row_key='id').classes('w-full')
+
+    @text_demo('Server-side pagination', '''
+        For large data, `ui.table.from_source` only sends the requested page to the client.
+        Sorting and filtering is done on the server.
+        The source can be a list of rows, a pandas DataFrame or an (async) function
+        which receives a `TableRequest` and returns the rows of the page and the total number of rows.
+    ''')
+    def server_side_pagination():
+        columns = [
+            {'name': 'id', 'label': 'ID', 'field': 'id', 'sortable': True},
+            {'name': 'square', 'label': 'Square', 'field': 'square', 'sortable': True},
+        ]
+        rows = [{'id': i, 'square': i**2} for i in range(100_000)]
+        table = ui.table.from_source(columns, rows, pagination=5)
+        ui.input('Search').bind_value(table, 'filter')